@@ -1,81 +1,60 @@
 import numpy as np
-import matplotlib.pyplot as plt
-from models.power_calc import PowerCalculator
+from typing import Optional
 from models.wind_profile import WindProfile
-from models.air_density import AirDensity
+from simulators.pipeline import build_simulation_pipeline
+from utils.memory import MemoryProfiler
 
-def run_simulation():
-    """풍력 발전 시스템 시뮬레이션을 실행합니다."""
-    
-    # 시뮬레이션 파라미터
-    duration = 10  # 분
-    time_step = 1  # 분
-    
-    # 풍속 프로파일 설정
-    wind_profile = WindProfile(
-        reference_height=10,  # 기준 높이 (m)
-        reference_speed=4.0,  # 기준 풍속 (m/s)
-        power_law_exponent=0.2  # 지수 법칙 지수
-    )
-    
-    # 공기 밀도 계산기
-    air_density = AirDensity()
-    
-    # 지상형 터빈 전력 계산기
-    ground_calculator = PowerCalculator(
-        power_coefficient=0.4,
-        area=100.0,  # 로터 면적 (m²)
-        cycle_efficiency=0.9,
-        system_type="ground"
-    )
-    
-    # AWE 시스템 전력 계산기
-    awe_calculator = PowerCalculator(
-        power_coefficient=0.4,
-        area=50.0,  # 날개 면적 (m²)
-        cycle_efficiency=0.85,
-        system_type="awe",
-        lift_coefficient=1.2,
-        drag_coefficient=0.1,
-        tether_drag_coefficient=0.2,
-        tether_length=350.0
-    )
-    
-    # 시간 배열 생성
-    time_points = np.arange(0, duration, time_step)
-    
-    # 각 시간별 풍속 계산
-    ground_wind_speeds = np.array([wind_profile.calculate_wind_speed(80, t) for t in time_points])
-    awe_wind_speeds = np.array([wind_profile.calculate_wind_speed(300, t) for t in time_points])
-    
-    # 각 시간별 공기 밀도 계산
-    ground_air_density = np.array([air_density.calculate_density(80) for _ in time_points])
-    awe_air_density = np.array([air_density.calculate_density(300) for _ in time_points])
-    
-    # 전력 계산
-    ground_power = ground_calculator.calculate_power(ground_wind_speeds, ground_air_density)
-    awe_power = awe_calculator.calculate_power(awe_wind_speeds, awe_air_density)
+def run_simulation(plot: bool = True, profiler: Optional[MemoryProfiler] = None):
+    """
+    풍력 발전 시스템 시뮬레이션을 실행합니다.
+    시뮬레이션은 simulators.pipeline의 파이프라인으로 계산되며,
+    기본 파라미터는 simulators.pipeline.DEFAULT_PARAMS와 config.yaml을 따릅니다.
+    
+    Args:
+        plot: 결과 그래프 저장 및 표시 여부
+        profiler: 단계별 메모리 계측기 (None이면 계측하지 않음)
+    
+    Returns:
+        시뮬레이션 결과 (SimulationResult)
+    """
+    
+    if profiler is None:
+        profiler = MemoryProfiler(enabled=False)
+    
+    # 시뮬레이션 파이프라인 (풍속장, 공기 밀도, 전력, 운전 범위 적용)
+    pipeline = build_simulation_pipeline(profiler=profiler)
+    params = pipeline.params
+    duration = params["duration"]  # 분
+    time_step = params["time_step"]  # 분
+    
+    # 결과 객체 (집계는 필요할 때 지연 계산)
+    result = pipeline.get("energy")
+    time_points = result.time
+    ground_wind_speeds = result["ground_wind_speed"]
+    awe_wind_speeds = result["awe_wind_speed"]
+    ground_air_density = result["ground_air_density"]
+    awe_air_density = result["awe_air_density"]
+    ground_power = result["ground_power"]
+    awe_power = result["awe_power"]
     
     # 누적 에너지 계산 (kWh)
-    ground_energy = np.sum(ground_power * time_step / 60)  # 분 -> 시간 변환
-    awe_energy = np.sum(awe_power * time_step / 60)  # 분 -> 시간 변환
-    
-    # 누적 에너지 배열 계산
-    ground_cumulative_energy = np.cumsum(ground_power * time_step / 60)
-    awe_cumulative_energy = np.cumsum(awe_power * time_step / 60)
+    with profiler.stage("total_energy"):
+        ground_energy = result.total_energy("ground_power")
+        awe_energy = result.total_energy("awe_power")
     
     # 결과 출력
     print("\n풍력 발전 시스템 시뮬레이션 결과:")
     print(f"시뮬레이션 기간: {duration}분")
     print(f"시간 간격: {time_step}분")
     print("\n풍속:")
-    print(f"10m 높이: {wind_profile.calculate_wind_speed(10, 0):.2f} m/s")
-    print(f"80m 높이 (지상형): {ground_wind_speeds[0]:.2f} m/s")
-    print(f"300m 높이 (AWE): {awe_wind_speeds[0]:.2f} m/s")
+    wind_profile = WindProfile(**params["wind_profile"])
+    print(f"10m 높이 (평균): {float(wind_profile.calculate_mean_wind_speed(10)):.2f} m/s")
+    print(f"{params['ground_height']:.0f}m 높이 (지상형): {ground_wind_speeds[0]:.2f} m/s")
+    print(f"{params['awe_height']:.0f}m 높이 (AWE): {awe_wind_speeds[0]:.2f} m/s")
     
     print("\n공기 밀도:")
-    print(f"80m 높이: {ground_air_density[0]:.3f} kg/m³")
-    print(f"300m 높이: {awe_air_density[0]:.3f} kg/m³")
+    print(f"{params['ground_height']:.0f}m 높이: {ground_air_density[0]:.3f} kg/m³")
+    print(f"{params['awe_height']:.0f}m 높이: {awe_air_density[0]:.3f} kg/m³")
     
     print("\n지상형 터빈:")
     print(f"평균 출력: {np.mean(ground_power):.2f} kW")
@@ -92,68 +71,16 @@ def run_simulation():
     print("-" * 35)
     for t, g_p, a_p in zip(time_points, ground_power, awe_power):
         print(f"{t:6.1f} | {g_p:9.2f} | {a_p:7.2f}")
-
-    # 분당 전력 생산량 그래프
-    plt.figure(figsize=(12, 6))
-    plt.plot(time_points, ground_power, 'b-', label='Ground Wind Turbine', linewidth=2)
-    plt.plot(time_points, awe_power, 'r-', label='AWE System', linewidth=2)
-    
-    # 그래프 스타일 설정
-    plt.title('Hourly Power Output Comparison', fontsize=14, pad=15)
-    plt.xlabel('Time (minutes)', fontsize=12)
-    plt.ylabel('Power (kW)', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(fontsize=10)
-    
-    # y축 범위 설정 (0부터 시작)
-    plt.ylim(bottom=0)
     
-    # 그래프 여백 조정
-    plt.tight_layout()
-    
-    # 그래프 저장
-    plt.savefig('power_production_comparison.png', dpi=300, bbox_inches='tight')
-    
-    # 누적 에너지 생산량 그래프
-    plt.figure(figsize=(12, 6))
-    plt.plot(time_points, ground_cumulative_energy, 'b-', label='Ground Wind Turbine', linewidth=2)
-    plt.plot(time_points, awe_cumulative_energy, 'r-', label='AWE System', linewidth=2)
-    
-    # 그래프 스타일 설정
-    plt.title('Cumulative Energy Production', fontsize=14, pad=15)
-    plt.xlabel('Time (minutes)', fontsize=12)
-    plt.ylabel('Cumulative Energy (kWh)', fontsize=12)
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.legend(fontsize=10)
-    
-    # y축 범위 설정 (0부터 시작)
-    plt.ylim(bottom=0)
-    
-    # 마지막 지점에 실제 값 표시
-    final_ground_energy = ground_cumulative_energy[-1]
-    final_awe_energy = awe_cumulative_energy[-1]
-    
-    # 박스 스타일 설정
-    box_style = dict(boxstyle='round', facecolor='white', alpha=0.8, edgecolor='gray')
-    
-    # 지상형 터빈 값 표시
-    plt.text(duration-0.5, final_ground_energy, 
-             f'Ground: {final_ground_energy:.2f} kWh',
-             bbox=box_style, ha='right', va='bottom')
-    
-    # AWE 시스템 값 표시
-    plt.text(duration-0.5, final_awe_energy,
-             f'AWE: {final_awe_energy:.2f} kWh',
-             bbox=box_style, ha='right', va='top')
-    
-    # 그래프 여백 조정
-    plt.tight_layout()
-    
-    # 그래프 저장
-    plt.savefig('cumulative_energy_comparison.png', dpi=300, bbox_inches='tight')
+    if profiler.records:
+        print("\n단계별 메모리 사용량:")
+        print(profiler.format_report())
+
+    if plot:
+        pipeline.get("plots")
     
-    # 모든 그래프 표시
-    plt.show()
+    return result
+
 
 if __name__ == "__main__":
     run_simulation()
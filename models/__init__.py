@@ -0,0 +1,39 @@
+"""
+물리적/수학적 모델 패키지
+
+하위 모듈은 처음 접근할 때 불러옵니다 (PEP 562).
+`import models`만으로는 어떤 모델 모듈도 불러오지 않으므로
+짧게 실행되는 작업 프로세스의 임포트 비용이 최소화됩니다.
+"""
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_EXPORTS = {
+    "AirDensity": "air_density",
+    "AirDensitySpec": "specs",
+    "OperatingEnvelope": "operating_envelope",
+    "PumpingCycleModel": "kite_dynamics",
+    "PowerCalculator": "power_calc",
+    "PowerSpec": "specs",
+    "WindProfile": "wind_profile",
+    "WindProfileSpec": "specs",
+    "load_config": "specs",
+    "load_specs": "specs",
+    "fit_log_law": "shear_fit",
+    "fit_power_law": "shear_fit",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
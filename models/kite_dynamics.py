@@ -0,0 +1,339 @@
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from models.power_calc import PowerCalculator
+
+# Dormand-Prince 5(4) 계수
+_DP_C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+_DP_A = [
+    np.array([]),
+    np.array([1/5]),
+    np.array([3/40, 9/40]),
+    np.array([44/45, -56/15, 32/9]),
+    np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+    np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+    np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84]),
+]
+_DP_B = np.array([35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84, 0.0])
+_DP_E = _DP_B - np.array([5179/57600, 0.0, 7571/16695, 393/640,
+                          -92097/339200, 187/2100, 1/40])
+
+
+def _dormand_prince_step(rhs: Callable[[float, np.ndarray], np.ndarray],
+                         t: float, y: np.ndarray, h: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Dormand-Prince 한 스텝을 계산하여 (5차 해, 오차 추정) 튜플을 반환합니다."""
+    k = np.empty((7, y.shape[0]))
+    for i in range(7):
+        k[i] = rhs(t + _DP_C[i] * h, y + h * (_DP_A[i] @ k[:i]))
+    return y + h * (_DP_B @ k), h * (_DP_E @ k)
+
+
+def integrate_adaptive(rhs: Callable[[float, np.ndarray], np.ndarray],
+                       y0: np.ndarray, t_max: float,
+                       event: Optional[Callable[[np.ndarray], float]] = None,
+                       rtol: float = 1e-4, atol: float = 1e-6,
+                       first_step: float = 1e-2, max_step: float = 10.0,
+                       event_tol: float = 1e-6) -> Dict[str, np.ndarray]:
+    """
+    적응형 스텝 Dormand-Prince 5(4) 방법으로 상미분 방정식을 적분합니다.
+    정상 구간에서는 큰 스텝을, 과도 구간에서는 작은 스텝을 사용합니다.
+    event(y)의 부호가 음에서 양으로 바뀌면 그 시점에서 적분을 멈춥니다.
+
+    Args:
+        rhs: 우변 함수 f(t, y)
+        y0: 초기 상태
+        t_max: 최대 적분 시간 (s)
+        event: 종료 조건 함수 (음 -> 양 교차 시 종료)
+        rtol: 상대 허용 오차
+        atol: 절대 허용 오차
+        first_step: 초기 스텝 크기 (s)
+        max_step: 최대 스텝 크기 (s)
+        event_tol: 종료 시점 탐색 허용 오차 (event 값 기준)
+
+    Returns:
+        t, y (스텝별 시간/상태), terminated (종료 조건 도달 여부),
+        n_rejected (거부된 스텝 수) 딕셔너리
+    """
+    t = 0.0
+    y = np.asarray(y0, dtype=float)
+    h = min(first_step, max_step, t_max)
+    times = [t]
+    states = [y]
+    n_rejected = 0
+    terminated = False
+
+    while t < t_max and not terminated:
+        h = min(h, t_max - t)
+        y_new, error = _dormand_prince_step(rhs, t, y, h)
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        error_norm = np.sqrt(np.mean((error / scale) ** 2))
+
+        if error_norm > 1.0:
+            # 스텝 거부: 오차에 맞춰 줄인 뒤 재시도
+            h *= max(0.2, 0.9 * error_norm ** -0.2)
+            n_rejected += 1
+            continue
+
+        if event is not None and event(y) < 0 <= event(y_new):
+            # 할선법으로 종료 시점까지의 스텝 크기를 찾습니다
+            g_low, g_high = event(y), event(y_new)
+            h_low, h_high = 0.0, h
+            y_event = y_new
+            for _ in range(50):
+                h_try = h_low + (h_high - h_low) * g_low / (g_low - g_high)
+                y_event, _ = _dormand_prince_step(rhs, t, y, h_try)
+                g_try = event(y_event)
+                if abs(g_try) <= event_tol:
+                    break
+                if g_try < 0:
+                    h_low, g_low = h_try, g_try
+                else:
+                    h_high, g_high = h_try, g_try
+            h, y_new = h_try, y_event
+            terminated = True
+
+        t += h
+        y = y_new
+        times.append(t)
+        states.append(y)
+
+        growth = 5.0 if error_norm == 0 else min(5.0, 0.9 * error_norm ** -0.2)
+        h = min(h * growth, max_step)
+
+    return {
+        "t": np.array(times),
+        "y": np.array(states),
+        "terminated": terminated,
+        "n_rejected": n_rejected,
+    }
+
+
+class PumpingCycleModel:
+    """
+    AWE 펌핑 사이클의 동적 카이트-테더 모델
+    릴아웃(발전) 구간과 릴인(회수) 구간을 윈치 동역학과 함께 적분하여
+    사이클당 평균 전력을 계산합니다.
+
+    상태: [테더 길이 L (m), 릴 속도 v_r (m/s), 윈치 에너지 E (J)]
+    테더 장력 (릴아웃): F = 0.5 * rho * A * C_L * G_e * (v_w * cos(theta) - v_r)^2
+    테더 장력 (릴인):   F = 0.5 * rho * A * C_D_in * (v_w * cos(theta) - v_r)^2
+    윈치 동역학:        m * dv_r/dt = F - F_winch
+    릴아웃 발전기 제어는 정상 상태에서 v_r = v_w * cos(theta) / 3 이 되도록 설정되므로,
+    정상 릴아웃 전력은 PowerCalculator의 준정상 AWE 공식과 일치합니다.
+
+    비행 경로는 준정상 횡풍(crosswind) 근사로 다룹니다: 카이트는 고정된 테더 각도 theta에서
+    8자 경로를 비행한다고 가정하고, 경로 위 위치에 따른 각도/겉보기 풍속 변화는 평균하여
+    유효 글라이드 비율 G_e에 포함합니다. 따라서 적분하는 상태는 테더 길이와 릴 속도뿐이며
+    카이트의 위치와 자세(3차원 궤적)는 모델링하지 않습니다.
+    """
+
+    def __init__(self, calculator: PowerCalculator,
+                 theta: float = 0.5,
+                 reel_out_length: float = 150.0,
+                 reel_in_speed: float = 8.0,
+                 depowered_coefficient: float = 0.1,
+                 winch_mass: float = 500.0,
+                 reel_in_gain: float = 2.0,
+                 speed_resolution: float = 0.25,
+                 density_resolution: float = 0.005,
+                 rtol: float = 1e-4,
+                 max_phase_time: float = 3600.0):
+        """
+        초기화 함수
+
+        Args:
+            calculator: AWE 시스템 전력 계산기 (system_type="awe")
+            theta: 테더 각도 (rad)
+            reel_out_length: 사이클당 릴아웃 길이 (m), 테더 길이에서 빼서 최소 길이를 정합니다
+            reel_in_speed: 릴인 목표 속도 (m/s)
+            depowered_coefficient: 릴인 시 디파워된 카이트의 장력 계수
+            winch_mass: 윈치/드럼 등가 질량 (kg)
+            reel_in_gain: 릴인 속도 제어 이득 (1/s)
+            speed_resolution: 캐시 키로 사용할 풍속 양자화 간격 (m/s)
+            density_resolution: 캐시 키로 사용할 공기 밀도 양자화 간격 (kg/m³)
+            rtol: 적분 상대 허용 오차
+            max_phase_time: 구간별 최대 적분 시간 (s)
+        """
+        if calculator.system_type != "awe":
+            raise ValueError("PumpingCycleModel은 AWE 시스템 계산기에만 사용할 수 있습니다.")
+        if not 0 < reel_out_length < calculator.tether_length:
+            raise ValueError("릴아웃 길이는 0보다 크고 테더 길이보다 작아야 합니다.")
+
+        self.calculator = calculator
+        self.theta = float(theta)
+        self.max_tether_length = calculator.tether_length
+        self.min_tether_length = calculator.tether_length - float(reel_out_length)
+        self.reel_in_speed = float(reel_in_speed)
+        self.depowered_coefficient = float(depowered_coefficient)
+        self.winch_mass = float(winch_mass)
+        self.reel_in_gain = float(reel_in_gain)
+        self.speed_resolution = float(speed_resolution)
+        self.density_resolution = float(density_resolution)
+        self.rtol = float(rtol)
+        self.max_phase_time = float(max_phase_time)
+
+        # 릴아웃 장력 계수 C_L * G_e (PowerCalculator의 준정상 공식과 동일)
+        self.traction_coefficient = (calculator.lift_coefficient *
+                                     calculator.calculate_effective_glide_ratio())
+        self._cache = {}
+
+    def _rhs(self, wind_speed: float, air_density: float, reel_out: bool):
+        """구간별 상태 미분 함수를 만듭니다."""
+        area = self.calculator.area
+        effective_wind = wind_speed * np.cos(self.theta)
+        if reel_out:
+            force_factor = 0.5 * air_density * area * self.traction_coefficient
+            # 정상 상태에서 v_r = v_w cos(theta) / 3 이 되는 이차 토크 제어
+            generator_gain = 4.0 * force_factor
+        else:
+            force_factor = 0.5 * air_density * area * self.depowered_coefficient
+        mass = self.winch_mass
+
+        def rhs(_t, y):
+            reel_speed = y[1]
+            apparent = effective_wind - reel_speed
+            tension = force_factor * apparent * abs(apparent)
+            if reel_out:
+                winch_force = generator_gain * reel_speed * abs(reel_speed)
+            else:
+                winch_force = tension + mass * self.reel_in_gain * (reel_speed + self.reel_in_speed)
+            return np.array([reel_speed, (tension - winch_force) / mass, winch_force * reel_speed])
+
+        return rhs
+
+    def simulate_cycle(self, wind_speed: float, air_density: float = 1.225,
+                       n_cycles: int = 2) -> Dict[str, Union[float, bool, np.ndarray]]:
+        """
+        한 풍속 조건에서 펌핑 사이클을 적분합니다.
+        마지막 사이클은 이전 사이클의 릴인 종료 상태에서 시작하므로 주기 정상 상태를 나타냅니다.
+
+        Args:
+            wind_speed: 카이트 고도 풍속 (m/s)
+            air_density: 공기 밀도 (kg/m³)
+            n_cycles: 적분할 사이클 수 (마지막 사이클을 결과로 사용)
+
+        Returns:
+            사이클 결과 딕셔너리
+            - feasible: 사이클 완주 여부
+            - cycle_time, reel_out_time, reel_in_time (s)
+            - reel_out_energy, reel_in_energy (kWh, 기계적, 릴인은 음수)
+            - cycle_power: 사이클 평균 전기 출력 (kW)
+            - t, tether_length, reel_speed, tension: 마지막 사이클 궤적
+            - n_steps: 마지막 사이클 적분 스텝 수
+        """
+        wind_speed = float(wind_speed)
+        air_density = float(air_density)
+        state = np.array([self.min_tether_length, -self.reel_in_speed, 0.0])
+        l_min, l_max = self.min_tether_length, self.max_tether_length
+
+        for _ in range(max(1, int(n_cycles))):
+            state[2] = 0.0
+            reel_out = integrate_adaptive(
+                self._rhs(wind_speed, air_density, True), state, self.max_phase_time,
+                event=lambda y: y[0] - l_max, rtol=self.rtol)
+            if not reel_out["terminated"]:
+                return self._infeasible(reel_out)
+
+            state = reel_out["y"][-1].copy()
+            state[2] = 0.0
+            reel_in = integrate_adaptive(
+                self._rhs(wind_speed, air_density, False), state, self.max_phase_time,
+                event=lambda y: l_min - y[0], rtol=self.rtol)
+            if not reel_in["terminated"]:
+                return self._infeasible(reel_in)
+            state = reel_in["y"][-1].copy()
+
+        reel_out_time = reel_out["t"][-1]
+        reel_in_time = reel_in["t"][-1]
+        cycle_time = reel_out_time + reel_in_time
+        reel_out_energy = reel_out["y"][-1, 2]
+        reel_in_energy = reel_in["y"][-1, 2]
+
+        # 발전 구간은 효율을 곱하고, 회수 구간 소비 전력은 효율로 나눕니다
+        efficiency = self.calculator.cycle_efficiency
+        electrical_energy = efficiency * reel_out_energy + reel_in_energy / efficiency
+
+        t = np.concatenate([reel_out["t"], reel_out_time + reel_in["t"][1:]])
+        y = np.concatenate([reel_out["y"], reel_in["y"][1:]])
+        apparent = wind_speed * np.cos(self.theta) - y[:, 1]
+        coefficient = np.where(t <= reel_out_time, self.traction_coefficient,
+                               self.depowered_coefficient)
+        tension = 0.5 * air_density * self.calculator.area * coefficient * apparent * np.abs(apparent)
+
+        return {
+            "feasible": True,
+            "cycle_time": cycle_time,
+            "reel_out_time": reel_out_time,
+            "reel_in_time": reel_in_time,
+            "reel_out_energy": reel_out_energy / 3.6e6,
+            "reel_in_energy": reel_in_energy / 3.6e6,
+            "cycle_power": electrical_energy / cycle_time / 1000,
+            "t": t,
+            "tether_length": y[:, 0],
+            "reel_speed": y[:, 1],
+            "tension": tension,
+            "n_steps": t.shape[0] - 1,
+        }
+
+    @staticmethod
+    def _infeasible(phase: Dict[str, np.ndarray]) -> Dict[str, Union[float, bool, np.ndarray]]:
+        """구간을 완주하지 못한 경우(풍속 부족 등)의 결과"""
+        return {
+            "feasible": False,
+            "cycle_time": np.inf,
+            "reel_out_time": np.nan,
+            "reel_in_time": np.nan,
+            "reel_out_energy": 0.0,
+            "reel_in_energy": 0.0,
+            "cycle_power": 0.0,
+            "t": phase["t"],
+            "tether_length": phase["y"][:, 0],
+            "reel_speed": phase["y"][:, 1],
+            "tension": np.zeros_like(phase["t"]),
+            "n_steps": phase["t"].shape[0] - 1,
+        }
+
+    def _cycle_power_cached(self, speed_key: int, density_key: int) -> float:
+        """양자화된 풍속/밀도 조건의 사이클 평균 전력을 캐시에서 가져오거나 계산합니다."""
+        key = (speed_key, density_key)
+        if key not in self._cache:
+            result = self.simulate_cycle(speed_key * self.speed_resolution,
+                                         density_key * self.density_resolution)
+            # 순 에너지가 음수인 조건에서는 운전하지 않습니다
+            self._cache[key] = max(result["cycle_power"], 0.0)
+        return self._cache[key]
+
+    def calculate_power(self, wind_speed: Union[float, np.ndarray],
+                        air_density: Union[float, np.ndarray] = 1.225) -> np.ndarray:
+        """
+        긴 시계열의 사이클 평균 전력을 계산합니다.
+        풍속과 밀도를 양자화하여 고유 조건만 한 번씩 적분하고,
+        결과는 호출 간에도 캐시되어 비슷한 풍속 조건에서 재사용됩니다.
+        풍속이나 밀도가 유한하지 않은 시점(결측 등)은 적분하지 않고 NaN을 반환합니다.
+
+        Args:
+            wind_speed: 풍속 (m/s)
+            air_density: 공기 밀도 (kg/m³)
+
+        Returns:
+            사이클 평균 전력 배열 (kW)
+        """
+        wind_speed, air_density = np.broadcast_arrays(np.atleast_1d(np.asarray(wind_speed, dtype=float)),
+                                                      np.asarray(air_density, dtype=float))
+        power = np.full(wind_speed.shape, np.nan)
+        finite = np.isfinite(wind_speed) & np.isfinite(air_density)
+        if not finite.any():
+            return power
+
+        speed_keys = np.rint(wind_speed[finite] / self.speed_resolution).astype(np.int64)
+        density_keys = np.rint(air_density[finite] / self.density_resolution).astype(np.int64)
+
+        keys = np.stack([speed_keys, density_keys], axis=1)
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        unique_power = np.array([self._cycle_power_cached(int(s), int(d)) for s, d in unique_keys])
+        power[finite] = unique_power[inverse.ravel()]
+        return power
+
+    def clear_cache(self) -> None:
+        """사이클 전력 캐시를 비웁니다."""
+        self._cache.clear()
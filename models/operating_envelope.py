@@ -0,0 +1,142 @@
+import numpy as np
+from typing import Dict, Optional, Union
+
+
+class OperatingEnvelope:
+    """
+    운전 범위(컷인, 정격 출력 제한, 컷아웃 히스테리시스, 재기동 지연)를 적용하는 클래스
+    지상형 터빈과 AWE 시스템 모두에 적용 가능
+
+    컷아웃은 상태에 의존합니다: 풍속이 cut_out_speed를 넘으면 정지하고,
+    풍속이 restart_speed 미만으로 restart_delay 동안 연속 유지되어야 재기동합니다.
+    상태 전이는 샘플별 파이썬 반복 없이 구간 길이(run-length) 계산으로 벡터화됩니다.
+    """
+
+    def __init__(self, rated_power: Optional[float] = None,
+                 cut_in_speed: float = 0.0,
+                 cut_out_speed: Optional[float] = None,
+                 restart_speed: Optional[float] = None,
+                 restart_delay: float = 0.0):
+        """
+        초기화 함수
+
+        Args:
+            rated_power: 정격 출력 (kW), None이면 제한 없음
+            cut_in_speed: 컷인 풍속 (m/s)
+            cut_out_speed: 컷아웃 풍속 (m/s), None이면 컷아웃 없음
+            restart_speed: 컷아웃 후 재기동 풍속 (m/s), 기본값은 cut_out_speed의 90%
+            restart_delay: 재기동 전 restart_speed 미만 유지 시간 (분)
+        """
+        self.rated_power = None if rated_power is None else float(rated_power)
+        self.cut_in_speed = float(cut_in_speed)
+        self.cut_out_speed = None if cut_out_speed is None else float(cut_out_speed)
+        if self.cut_out_speed is not None:
+            if self.cut_in_speed >= self.cut_out_speed:
+                raise ValueError("cut_in_speed는 cut_out_speed보다 작아야 합니다.")
+            if restart_speed is None:
+                restart_speed = 0.9 * self.cut_out_speed
+            if not restart_speed <= self.cut_out_speed:
+                raise ValueError("restart_speed는 cut_out_speed 이하여야 합니다.")
+        self.restart_speed = None if restart_speed is None else float(restart_speed)
+        self.restart_delay = float(restart_delay)
+        if self.restart_delay < 0:
+            raise ValueError("restart_delay는 음수일 수 없습니다.")
+
+    @staticmethod
+    def spec_arguments(spec) -> Dict[str, Optional[float]]:
+        """
+        PowerSpec의 운전 범위 값(rated_power, cut_in_speed, cut_out_speed)을
+        생성자 인자 딕셔너리로 반환합니다.
+
+        Args:
+            spec: models.specs.PowerSpec
+
+        Returns:
+            생성자 인자 딕셔너리
+        """
+        return {"rated_power": spec.rated_power,
+                "cut_in_speed": spec.cut_in_speed or 0.0,
+                "cut_out_speed": spec.cut_out_speed}
+
+    @classmethod
+    def from_spec(cls, spec, restart_speed: Optional[float] = None,
+                  restart_delay: float = 0.0) -> "OperatingEnvelope":
+        """
+        PowerSpec(config.yaml의 rated_power, cut_in/cut_out 또는 min/max_wind_speed)으로 만듭니다.
+
+        Args:
+            spec: models.specs.PowerSpec
+            restart_speed: 컷아웃 후 재기동 풍속 (m/s)
+            restart_delay: 재기동 지연 (분)
+
+        Returns:
+            OperatingEnvelope
+        """
+        return cls(**cls.spec_arguments(spec), restart_speed=restart_speed,
+                   restart_delay=restart_delay)
+
+    def operating_mask(self, wind_speed: Union[float, np.ndarray], time_step: float = 1.0,
+                       initially_stopped: bool = False) -> np.ndarray:
+        """
+        컷아웃 히스테리시스와 재기동 지연을 반영한 운전 가능 여부를 계산합니다 (컷인 제외).
+
+        Args:
+            wind_speed: 1차원 풍속 시계열 (m/s)
+            time_step: 시간 간격 (분)
+            initially_stopped: 시계열 시작 시점에 컷아웃 정지 상태인지 여부
+
+        Returns:
+            운전 가능 여부 배열 (bool)
+        """
+        wind_speed = np.atleast_1d(np.asarray(wind_speed, dtype=float))
+        if wind_speed.ndim != 1:
+            raise ValueError(f"풍속 시계열은 1차원이어야 합니다: shape={wind_speed.shape}")
+        valid = np.isfinite(wind_speed)
+        if self.cut_out_speed is None:
+            return valid
+
+        n = wind_speed.shape[0]
+        index = np.arange(n)
+        trip = wind_speed > self.cut_out_speed
+        calm = wind_speed < self.restart_speed
+
+        # 현재 시점까지 연속된 calm 구간 길이 (구간 시작마다 초기화)
+        last_not_calm = np.maximum.accumulate(np.where(calm, -1, index))
+        calm_run = index - last_not_calm
+
+        # calm이 restart_delay 동안 연속되면 재기동 (최소 1 샘플)
+        delay_samples = max(int(np.ceil(self.restart_delay / time_step - 1e-9)), 1)
+        restart = calm & (calm_run == delay_samples)
+
+        last_trip = np.maximum.accumulate(np.where(trip, index, -1))
+        last_restart = np.maximum.accumulate(np.where(restart, index, -1))
+        if initially_stopped:
+            # 시작 직전에 정지가 발생한 것으로 간주 (index -0.5)
+            last_trip = np.where(last_trip < 0, -0.5, last_trip)
+
+        stopped = last_trip > last_restart
+        return valid & ~stopped
+
+    def apply(self, wind_speed: Union[float, np.ndarray], power: Union[float, np.ndarray],
+              time_step: float = 1.0, initially_stopped: bool = False) -> np.ndarray:
+        """
+        전력 시계열에 운전 범위를 적용합니다.
+        컷인 미만과 컷아웃 정지 구간은 0, 나머지는 정격 출력으로 제한됩니다.
+
+        Args:
+            wind_speed: 풍속 시계열 (m/s)
+            power: 제한 전 전력 시계열 (kW)
+            time_step: 시간 간격 (분)
+            initially_stopped: 시계열 시작 시점에 컷아웃 정지 상태인지 여부
+
+        Returns:
+            운전 범위가 적용된 전력 배열 (kW)
+        """
+        wind_speed = np.atleast_1d(np.asarray(wind_speed, dtype=float))
+        power = np.broadcast_to(np.asarray(power, dtype=float), wind_speed.shape)
+
+        operating = self.operating_mask(wind_speed, time_step, initially_stopped)
+        operating &= wind_speed >= self.cut_in_speed
+        if self.rated_power is not None:
+            power = np.minimum(power, self.rated_power)
+        return np.where(operating, power, 0.0)
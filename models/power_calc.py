@@ -1,5 +1,8 @@
 import numpy as np
-from typing import Union, Tuple, List
+from typing import TYPE_CHECKING, Union, Tuple, List, Optional
+
+if TYPE_CHECKING:
+    from models.operating_envelope import OperatingEnvelope
 
 class PowerCalculator:
     """
@@ -15,7 +18,9 @@ class PowerCalculator:
                  lift_coefficient: float = 1.2,
                  drag_coefficient: float = 0.1,
                  tether_drag_coefficient: float = 0.2,
-                 tether_length: float = 350.0):
+                 tether_length: float = 350.0,
+                 # 운전 범위 (컷인/정격/컷아웃), None이면 제한 없음
+                 envelope: Optional["OperatingEnvelope"] = None):
         """
         초기화 함수
         
@@ -28,11 +33,13 @@ class PowerCalculator:
             drag_coefficient: 항력 계수 (AWE 시스템용)
             tether_drag_coefficient: 테더 항력 계수 (AWE 시스템용)
             tether_length: 테더 길이 (m) (AWE 시스템용)
+            envelope: 운전 범위 (OperatingEnvelope), calculate_actual_power에서 적용
         """
         self.power_coefficient = float(power_coefficient)
         self.area = float(area)
         self.cycle_efficiency = float(cycle_efficiency)
         self.system_type = system_type
+        self.envelope = envelope
         
         # AWE 시스템 특성
         if system_type == "awe":
@@ -112,6 +119,28 @@ class PowerCalculator:
         
         return electrical_power
     
+    def calculate_actual_power(self, wind_speed: Union[float, np.ndarray],
+                               air_density: Union[float, np.ndarray] = 1.225,
+                               theta: float = 0.0,
+                               time_step: float = 1.0) -> np.ndarray:
+        """
+        운전 범위(컷인, 정격 출력 제한, 컷아웃 히스테리시스)를 적용한 전력을 계산합니다.
+        envelope가 없으면 calculate_power와 같습니다.
+        
+        Args:
+            wind_speed: 풍속 시계열 (m/s)
+            air_density: 공기 밀도 (kg/m³)
+            theta: 테더 각도 (rad) (AWE 시스템용)
+            time_step: 시간 간격 (분) (재기동 지연 계산용)
+            
+        Returns:
+            전력 생산량 배열 (kW)
+        """
+        power = self.calculate_power(wind_speed, air_density, theta)
+        if self.envelope is None:
+            return power
+        return self.envelope.apply(wind_speed, power, time_step)
+    
     def calculate_power_curve(self, wind_speeds: np.ndarray,
                             air_density: float = 1.225,
                             theta: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
@@ -0,0 +1,123 @@
+import numpy as np
+from typing import Optional, Tuple
+
+# 폰 카르만 상수
+VON_KARMAN = 0.41
+
+
+def _masked_linear_fit(x: np.ndarray, y: np.ndarray,
+                       valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    행별 최소제곱 직선 y = slope * x + intercept 를 한 번에 계산합니다.
+    유효하지 않은 값은 합계에서 제외되며, 유효 점이 2개 미만인 행은 NaN입니다.
+
+    Args:
+        x: 설명 변수 (n, k)
+        y: 목적 변수 (n, k)
+        valid: 유효 값 마스크 (n, k)
+
+    Returns:
+        (기울기 배열, 절편 배열) 튜플, 각각 (n,)
+    """
+    x = np.where(valid, x, 0.0)
+    y = np.where(valid, y, 0.0)
+    count = valid.sum(axis=1)
+    sum_x = x.sum(axis=1)
+    sum_y = y.sum(axis=1)
+    sum_xx = np.einsum("ij,ij->i", x, x)
+    sum_xy = np.einsum("ij,ij->i", x, y)
+
+    denominator = count * sum_xx - sum_x**2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = (count * sum_xy - sum_x * sum_y) / denominator
+        intercept = (sum_y - slope * sum_x) / count
+    degenerate = (count < 2) | (np.abs(denominator) <= 1e-12 * np.maximum(count * sum_xx, 1.0))
+    slope[degenerate] = np.nan
+    intercept[degenerate] = np.nan
+    return slope, intercept
+
+
+def _validate(heights: np.ndarray, speeds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    heights = np.asarray(heights, dtype=float)
+    speeds = np.asarray(speeds, dtype=float)
+    if speeds.ndim == 1:
+        speeds = speeds[np.newaxis, :]
+    if heights.ndim != 1 or speeds.ndim != 2 or speeds.shape[1] != heights.shape[0]:
+        raise ValueError("speeds는 (시간 스텝 수, 고도 수) 형태이고 heights와 열 수가 같아야 합니다.")
+    if np.any(heights <= 0):
+        raise ValueError("측정 고도는 양수여야 합니다.")
+    return heights, speeds
+
+
+def fit_power_law(heights: np.ndarray, speeds: np.ndarray,
+                  reference_height: float = 10.0,
+                  min_speed: float = 0.5,
+                  chunk_size: Optional[int] = 1_000_000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    다중 고도 관측 풍속으로 시간 스텝별 지수 법칙 지수를 추정합니다.
+    ln(v) = alpha * ln(z / z_ref) + ln(v_ref) 를 모든 행에 대해 벡터화된 최소제곱으로 풉니다.
+    NaN이나 min_speed 미만의 풍속은 해당 행의 적합에서 제외됩니다.
+
+    Args:
+        heights: 측정 고도 배열 (m), (k,)
+        speeds: 관측 풍속 배열 (m/s), (n, k)
+        reference_height: 기준 고도 (m)
+        min_speed: 적합에 사용할 최소 풍속 (m/s)
+        chunk_size: 한 번에 처리할 행 수 (중간 배열 메모리 제한, None이면 전체)
+
+    Returns:
+        (지수 법칙 지수 배열, 기준 고도 풍속 배열) 튜플, 각각 (n,)
+        유효 고도가 2개 미만인 행은 NaN
+    """
+    heights, speeds = _validate(heights, speeds)
+    log_heights = np.log(heights / reference_height)
+
+    n_rows = speeds.shape[0]
+    chunk_size = n_rows if not chunk_size else int(chunk_size)
+    exponents = np.empty(n_rows)
+    reference_speeds = np.empty(n_rows)
+    for start in range(0, n_rows, max(chunk_size, 1)):
+        block = speeds[start:start + chunk_size]
+        valid = np.isfinite(block) & (block >= min_speed)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_speeds = np.log(np.where(valid, block, 1.0))
+        x = np.broadcast_to(log_heights, block.shape)
+        slope, intercept = _masked_linear_fit(x, log_speeds, valid)
+        exponents[start:start + chunk_size] = slope
+        reference_speeds[start:start + chunk_size] = np.exp(intercept)
+    return exponents, reference_speeds
+
+
+def fit_log_law(heights: np.ndarray, speeds: np.ndarray,
+                min_speed: float = 0.5,
+                chunk_size: Optional[int] = 1_000_000) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    다중 고도 관측 풍속으로 시간 스텝별 로그 법칙 파라미터를 추정합니다.
+    v(z) = (u* / kappa) * ln(z / z0) 를 v = a * ln(z) + b 로 벡터화된 최소제곱 적합합니다.
+
+    Args:
+        heights: 측정 고도 배열 (m), (k,)
+        speeds: 관측 풍속 배열 (m/s), (n, k)
+        min_speed: 적합에 사용할 최소 풍속 (m/s)
+        chunk_size: 한 번에 처리할 행 수 (중간 배열 메모리 제한, None이면 전체)
+
+    Returns:
+        (마찰 속도 u* 배열 (m/s), 거칠기 길이 z0 배열 (m)) 튜플, 각각 (n,)
+        풍속이 고도에 따라 증가하지 않는 행은 NaN
+    """
+    heights, speeds = _validate(heights, speeds)
+    log_heights = np.log(heights)
+
+    n_rows = speeds.shape[0]
+    chunk_size = n_rows if not chunk_size else int(chunk_size)
+    friction_velocity = np.empty(n_rows)
+    roughness_length = np.empty(n_rows)
+    for start in range(0, n_rows, max(chunk_size, 1)):
+        block = speeds[start:start + chunk_size]
+        valid = np.isfinite(block) & (block >= min_speed)
+        x = np.broadcast_to(log_heights, block.shape)
+        slope, intercept = _masked_linear_fit(x, block, valid)
+        slope[~(slope > 0)] = np.nan
+        friction_velocity[start:start + chunk_size] = VON_KARMAN * slope
+        roughness_length[start:start + chunk_size] = np.exp(-intercept / slope)
+    return friction_velocity, roughness_length
@@ -0,0 +1,391 @@
+"""
+config.yaml로부터 한 번 검증/컴파일되는 불변 모델 명세
+
+WindProfile, AirDensity, PowerCalculator와 같은 식을 사용하지만
+호출마다 반복되던 파생 상수(글라이드 비율, 전력 계수, lapse_rate / T0,
+reference_speed / reference_height**alpha)를 생성 시 한 번만 계산합니다.
+__slots__ 기반의 불변 객체이므로 작업 프로세스로 싸게 피클링할 수 있습니다.
+"""
+import os
+
+import numpy as np
+from typing import Any, Dict, Optional, Tuple, Union
+
+ArrayLike = Union[float, np.ndarray]
+
+# 저장소 루트의 설정 파일 (작업 디렉터리와 무관)
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "config.yaml")
+
+
+class _FrozenSpec:
+    """불변 명세 기반 클래스 (생성 후 속성 변경 불가)"""
+
+    __slots__ = ()
+    # 생성자 인자 이름 (피클링/비교/repr에 사용)
+    _fields: Tuple[str, ...] = ()
+
+    def _freeze(self, **values: Any) -> None:
+        for name, value in values.items():
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__}는 변경할 수 없습니다.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__}는 변경할 수 없습니다.")
+
+    def _args(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self._fields)
+
+    def __reduce__(self):
+        # 파생 상수는 보내지 않고 생성자 인자만 피클링
+        return type(self), self._args()
+
+    def __eq__(self, other: object) -> bool:
+        return type(self) is type(other) and self._args() == other._args()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._args()))
+
+    def __repr__(self) -> str:
+        args = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{type(self).__name__}({args})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(zip(self._fields, self._args()))
+
+
+def _positive(name: str, value: float) -> float:
+    value = float(value)
+    if not value > 0:
+        raise ValueError(f"{name}는 양수여야 합니다: {value}")
+    return value
+
+
+def _fraction(name: str, value: float) -> float:
+    value = float(value)
+    if not 0 < value <= 1:
+        raise ValueError(f"{name}는 0보다 크고 1 이하여야 합니다: {value}")
+    return value
+
+
+def _optional_positive(name: str, value: Optional[float]) -> Optional[float]:
+    return None if value is None else _positive(name, value)
+
+
+class WindProfileSpec(_FrozenSpec):
+    """
+    지수 법칙 풍속 프로파일 명세
+    v(z) = v_ref * (z / z_ref)^alpha = scale * z^alpha
+    """
+
+    __slots__ = ("reference_height", "reference_speed", "power_law_exponent",
+                 "max_height", "scale")
+    _fields = ("reference_height", "reference_speed", "power_law_exponent", "max_height")
+
+    def __init__(self, reference_height: float, reference_speed: float,
+                 power_law_exponent: float = 0.14, max_height: Optional[float] = None):
+        """
+        초기화 함수
+
+        Args:
+            reference_height: 기준 고도 (m)
+            reference_speed: 기준 고도에서의 풍속 (m/s)
+            power_law_exponent: 지수 법칙 지수
+            max_height: 모델 적용 최대 고도 (m)
+        """
+        reference_height = _positive("reference_height", reference_height)
+        reference_speed = float(reference_speed)
+        if reference_speed < 0:
+            raise ValueError(f"reference_speed는 음수일 수 없습니다: {reference_speed}")
+        power_law_exponent = float(power_law_exponent)
+        if not 0 <= power_law_exponent < 1:
+            raise ValueError(f"power_law_exponent는 0 이상 1 미만이어야 합니다: {power_law_exponent}")
+
+        self._freeze(
+            reference_height=reference_height,
+            reference_speed=reference_speed,
+            power_law_exponent=power_law_exponent,
+            max_height=_optional_positive("max_height", max_height),
+            scale=reference_speed / reference_height ** power_law_exponent,
+        )
+
+    def mean_wind_speed(self, height: ArrayLike) -> ArrayLike:
+        """
+        평균 풍속을 계산합니다 (시간 변동/난류 제외).
+
+        Args:
+            height: 고도 (m), max_height 이하
+
+        Returns:
+            평균 풍속 (m/s)
+        """
+        height = np.asarray(height, dtype=float)
+        if self.max_height is not None and np.any(height > self.max_height):
+            raise ValueError(f"고도가 모델 적용 최대 고도({self.max_height} m)를 넘습니다: "
+                             f"{np.max(height)} m")
+        return self.scale * np.power(height, self.power_law_exponent)
+
+
+class AirDensitySpec(_FrozenSpec):
+    """
+    지수 감소 공기 밀도 명세
+    rho(z) = rho_0 * exp(-decay * z), decay = a / T0
+    """
+
+    __slots__ = ("sea_level_density", "temperature_lapse_rate", "sea_level_temperature", "decay")
+    _fields = ("sea_level_density", "temperature_lapse_rate", "sea_level_temperature")
+
+    def __init__(self, sea_level_density: float = 1.225,
+                 temperature_lapse_rate: float = 0.0065,
+                 sea_level_temperature: float = 288.15):
+        """
+        초기화 함수
+
+        Args:
+            sea_level_density: 해수면 공기 밀도 (kg/m³)
+            temperature_lapse_rate: 온도 감소율 (K/m)
+            sea_level_temperature: 해수면 온도 (K)
+        """
+        temperature_lapse_rate = float(temperature_lapse_rate)
+        if temperature_lapse_rate < 0:
+            raise ValueError(f"temperature_lapse_rate는 음수일 수 없습니다: {temperature_lapse_rate}")
+        sea_level_temperature = _positive("sea_level_temperature", sea_level_temperature)
+
+        self._freeze(
+            sea_level_density=_positive("sea_level_density", sea_level_density),
+            temperature_lapse_rate=temperature_lapse_rate,
+            sea_level_temperature=sea_level_temperature,
+            decay=temperature_lapse_rate / sea_level_temperature,
+        )
+
+    def density(self, height: ArrayLike) -> ArrayLike:
+        """
+        공기 밀도를 계산합니다.
+
+        Args:
+            height: 고도 (m)
+
+        Returns:
+            공기 밀도 (kg/m³)
+        """
+        return self.sea_level_density * np.exp(-self.decay * np.asarray(height, dtype=float))
+
+
+class PowerSpec(_FrozenSpec):
+    """
+    지상형 터빈 / AWE 시스템 전력 명세
+    P = power_factor * rho * V^3 (kW)
+    power_factor = 0.5 * A * C_p * eta / 1000 은 생성 시 한 번 계산됩니다.
+    AWE 시스템의 C_p = (4/27) * C_L * G_e * cos^3(theta) 입니다.
+    """
+
+    __slots__ = ("system_type", "area", "power_coefficient", "cycle_efficiency",
+                 "lift_coefficient", "drag_coefficient", "tether_drag_coefficient",
+                 "tether_length", "theta", "height", "rated_power", "cut_in_speed",
+                 "cut_out_speed", "glide_ratio", "effective_power_coefficient", "power_factor")
+    _fields = ("system_type", "area", "power_coefficient", "cycle_efficiency",
+               "lift_coefficient", "drag_coefficient", "tether_drag_coefficient",
+               "tether_length", "theta", "height", "rated_power", "cut_in_speed",
+               "cut_out_speed")
+
+    def __init__(self, system_type: str = "ground",
+                 area: float = 1000.0,
+                 power_coefficient: float = 0.4,
+                 cycle_efficiency: float = 0.9,
+                 lift_coefficient: float = 1.2,
+                 drag_coefficient: float = 0.1,
+                 tether_drag_coefficient: float = 0.2,
+                 tether_length: float = 350.0,
+                 theta: float = 0.0,
+                 height: Optional[float] = None,
+                 rated_power: Optional[float] = None,
+                 cut_in_speed: Optional[float] = None,
+                 cut_out_speed: Optional[float] = None):
+        """
+        초기화 함수
+
+        Args:
+            system_type: 시스템 유형 ("ground" 또는 "awe")
+            area: 로터/날개 면적 (m²)
+            power_coefficient: 전력 계수 (지상형 터빈용)
+            cycle_efficiency: 전체 효율
+            lift_coefficient: 양력 계수 (AWE 시스템용)
+            drag_coefficient: 항력 계수 (AWE 시스템용)
+            tether_drag_coefficient: 테더 항력 계수 (AWE 시스템용)
+            tether_length: 테더 길이 (m) (AWE 시스템용)
+            theta: 테더 각도 (rad) (AWE 시스템용)
+            height: 허브/작동 고도 (m)
+            rated_power: 정격 출력 (kW)
+            cut_in_speed: 컷인 풍속 (m/s)
+            cut_out_speed: 컷아웃 풍속 (m/s)
+        """
+        if system_type not in ("ground", "awe"):
+            raise ValueError(f"system_type은 'ground' 또는 'awe'여야 합니다: {system_type}")
+        area = _positive("area", area)
+        power_coefficient = float(power_coefficient)
+        lift_coefficient = float(lift_coefficient)
+        drag_coefficient = _positive("drag_coefficient", drag_coefficient)
+        tether_drag_coefficient = float(tether_drag_coefficient)
+        tether_length = _positive("tether_length", tether_length)
+        theta = float(theta)
+        cycle_efficiency = _fraction("cycle_efficiency", cycle_efficiency)
+        cut_in_speed = None if cut_in_speed is None else float(cut_in_speed)
+        cut_out_speed = _optional_positive("cut_out_speed", cut_out_speed)
+        if cut_in_speed is not None and cut_out_speed is not None and cut_in_speed >= cut_out_speed:
+            raise ValueError("cut_in_speed는 cut_out_speed보다 작아야 합니다.")
+
+        if system_type == "awe":
+            # 유효 글라이드 비율 G_e = C_L / (C_D + C_T * (l / sqrt(A))), 최소 5
+            tether_drag_term = tether_drag_coefficient * (tether_length / np.sqrt(area))
+            glide_ratio = max(lift_coefficient / (drag_coefficient + tether_drag_term), 5.0)
+            effective_power_coefficient = (4/27) * lift_coefficient * glide_ratio * np.cos(theta)**3
+        else:
+            if not 0 < power_coefficient < 16/27:
+                raise ValueError(f"power_coefficient는 0과 베츠 한계 사이여야 합니다: {power_coefficient}")
+            glide_ratio = 0.0
+            effective_power_coefficient = power_coefficient
+
+        self._freeze(
+            system_type=system_type,
+            area=area,
+            power_coefficient=power_coefficient,
+            cycle_efficiency=cycle_efficiency,
+            lift_coefficient=lift_coefficient,
+            drag_coefficient=drag_coefficient,
+            tether_drag_coefficient=tether_drag_coefficient,
+            tether_length=tether_length,
+            theta=theta,
+            height=_optional_positive("height", height),
+            rated_power=_optional_positive("rated_power", rated_power),
+            cut_in_speed=cut_in_speed,
+            cut_out_speed=cut_out_speed,
+            glide_ratio=float(glide_ratio),
+            effective_power_coefficient=float(effective_power_coefficient),
+            power_factor=float(0.5 * area * effective_power_coefficient * cycle_efficiency / 1000),
+        )
+
+    def power(self, wind_speed: ArrayLike, air_density: ArrayLike = 1.225) -> np.ndarray:
+        """
+        전력 생산량을 계산합니다 (PowerCalculator.calculate_power와 같은 식).
+
+        Args:
+            wind_speed: 풍속 (m/s)
+            air_density: 공기 밀도 (kg/m³)
+
+        Returns:
+            전력 생산량 배열 (kW)
+        """
+        wind_speed = np.asarray(wind_speed, dtype=float)
+        air_density = np.asarray(air_density, dtype=float)
+        return self.power_factor * air_density * (wind_speed * wind_speed * wind_speed)
+
+    @classmethod
+    def from_calculator(cls, calculator, **operating: Any) -> "PowerSpec":
+        """
+        기존 PowerCalculator 설정으로 명세를 만듭니다.
+
+        Args:
+            calculator: PowerCalculator 인스턴스
+            operating: theta, height, rated_power 등 추가 인자
+
+        Returns:
+            PowerSpec
+        """
+        kwargs = {"system_type": calculator.system_type, "area": calculator.area,
+                  "power_coefficient": calculator.power_coefficient,
+                  "cycle_efficiency": calculator.cycle_efficiency}
+        if calculator.system_type == "awe":
+            kwargs.update(lift_coefficient=calculator.lift_coefficient,
+                          drag_coefficient=calculator.drag_coefficient,
+                          tether_drag_coefficient=calculator.tether_drag_coefficient,
+                          tether_length=calculator.tether_length)
+        kwargs.update(operating)
+        return cls(**kwargs)
+
+
+# config.yaml 섹션 키 -> PowerSpec 인자 이름
+_GROUND_KEYS = {"hub_height": "height", "rated_power": "rated_power",
+                "cut_in_speed": "cut_in_speed", "cut_out_speed": "cut_out_speed"}
+_AWE_KEYS = {"operating_height": "height", "tether_length": "tether_length",
+             "rated_power": "rated_power", "min_wind_speed": "cut_in_speed",
+             "max_wind_speed": "cut_out_speed"}
+
+# 설정 파일에 없는 시스템 특성의 기본값 (main.run_simulation과 동일)
+_GROUND_DEFAULTS = {"power_coefficient": 0.4, "cycle_efficiency": 0.9}
+_AWE_DEFAULTS = {"area": 50.0, "power_coefficient": 0.4, "cycle_efficiency": 0.85,
+                 "lift_coefficient": 1.2, "drag_coefficient": 0.1,
+                 "tether_drag_coefficient": 0.2}
+
+
+def _section_kwargs(section: Dict[str, Any], names: Dict[str, str],
+                    section_name: str) -> Dict[str, Any]:
+    unknown = set(section) - set(names)
+    if unknown:
+        raise ValueError(f"'{section_name}' 섹션에 알 수 없는 키가 있습니다: {sorted(unknown)}")
+    return {names[key]: value for key, value in section.items()}
+
+
+def compile_specs(config: Dict[str, Any]) -> Dict[str, _FrozenSpec]:
+    """
+    설정 딕셔너리로부터 모든 모델 명세를 검증/컴파일합니다.
+
+    Args:
+        config: config.yaml과 같은 구조의 설정 딕셔너리
+
+    Returns:
+        "wind_profile", "air_density", "ground_turbine", "awe_system" 키의 명세 딕셔너리
+        (설정에 없는 섹션은 생략)
+    """
+    specs = {}
+    if "wind_profile" in config:
+        specs["wind_profile"] = WindProfileSpec(**config["wind_profile"])
+    if "air_density" in config:
+        specs["air_density"] = AirDensitySpec(**config["air_density"])
+    if "ground_turbine" in config:
+        section = dict(config["ground_turbine"])
+        kwargs = dict(_GROUND_DEFAULTS, system_type="ground")
+        kwargs.update({key: section.pop(key) for key in ("area", "power_coefficient", "cycle_efficiency")
+                       if key in section})
+        if "rotor_diameter" in section:
+            kwargs["area"] = np.pi * (_positive("rotor_diameter", section.pop("rotor_diameter")) / 2) ** 2
+        kwargs.update(_section_kwargs(section, _GROUND_KEYS, "ground_turbine"))
+        specs["ground_turbine"] = PowerSpec(**kwargs)
+    if "awe_system" in config:
+        section = dict(config["awe_system"])
+        kwargs = dict(_AWE_DEFAULTS, system_type="awe")
+        kwargs.update({key: section.pop(key) for key in list(_AWE_DEFAULTS) + ["theta"]
+                       if key in section})
+        kwargs.update(_section_kwargs(section, _AWE_KEYS, "awe_system"))
+        specs["awe_system"] = PowerSpec(**kwargs)
+    return specs
+
+
+def load_config(path: Optional[str] = None) -> Dict[str, Any]:
+    """
+    config.yaml을 설정 딕셔너리로 읽습니다.
+    pyyaml은 이 함수를 호출할 때만 불러옵니다.
+
+    Args:
+        path: 설정 파일 경로 (None이면 저장소 루트의 config.yaml)
+
+    Returns:
+        설정 딕셔너리
+    """
+    import yaml
+
+    with open(path or CONFIG_PATH, encoding="utf-8") as config_file:
+        return yaml.safe_load(config_file)
+
+
+def load_specs(path: Optional[str] = None) -> Dict[str, _FrozenSpec]:
+    """
+    config.yaml을 읽어 모델 명세를 컴파일합니다.
+
+    Args:
+        path: 설정 파일 경로 (None이면 저장소 루트의 config.yaml)
+
+    Returns:
+        compile_specs 결과
+    """
+    return compile_specs(load_config(path))
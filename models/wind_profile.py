@@ -1,5 +1,5 @@
 import numpy as np
-from typing import Union, List
+from typing import Union, List, Optional
 
 class WindProfile:
     """
@@ -51,6 +51,67 @@ class WindProfile:
         # 풍속이 음수가 되지 않도록 보정
         return max(wind_speed, 0.1)
     
+    def calculate_mean_wind_speed(self, height: Union[float, np.ndarray]) -> np.ndarray:
+        """
+        시간 변동과 난류를 제외한 평균 풍속을 계산합니다 (결정적).
+        v(z) = v_ref * (z / z_ref)^alpha
+
+        Args:
+            height: 고도 (m), 스칼라 또는 배열
+
+        Returns:
+            평균 풍속 (m/s)
+        """
+        height = np.asarray(height, dtype=float)
+        return self.reference_speed * (height / self.reference_height) ** self.power_law_exponent
+
+    def calculate_wind_speed_series(self, height: float, times: np.ndarray,
+                                    power_law_exponent: Optional[np.ndarray] = None,
+                                    reference_speed: Optional[np.ndarray] = None,
+                                    turbulence: bool = True,
+                                    time_variation: bool = True,
+                                    rng: Optional[np.random.Generator] = None) -> np.ndarray:
+        """
+        한 고도의 풍속 시계열을 한 번에 계산합니다.
+        시간 스텝별로 다른 지수 법칙 지수(예: shear_fit.fit_power_law 결과)를 사용할 수 있습니다.
+        합성 변동(사인파, 난류)은 시간 스텝별 기준 풍속에 비례합니다. 관측 마스트 적합 결과를
+        그대로 외삽하려면 time_variation=False, turbulence=False로 합성 변동을 끕니다.
+
+        Args:
+            height: 계산할 고도 (m)
+            times: 시간 배열 (분)
+            power_law_exponent: 시간 스텝별 지수 배열 (None이면 고정 지수 사용)
+            reference_speed: 시간 스텝별 기준 고도 풍속 배열 (None이면 고정 기준 풍속 사용)
+            turbulence: 난류(가우시안 노이즈) 포함 여부
+            time_variation: 1시간 주기 사인파 변동 포함 여부
+            rng: 난류 생성용 난수 생성기 (None이면 np.random 전역 상태 사용)
+
+        Returns:
+            풍속 배열 (m/s)
+        """
+        times = np.asarray(times, dtype=float)
+        alpha = (self.power_law_exponent if power_law_exponent is None
+                 else np.asarray(power_law_exponent, dtype=float))
+        speed = (self.reference_speed if reference_speed is None
+                 else np.asarray(reference_speed, dtype=float))
+
+        # 기본 풍속 계산 (파워 로우 모델)
+        base_speed = speed * (height / self.reference_height) ** alpha
+
+        wind_speed = base_speed
+
+        # 시간에 따른 풍속 변동 추가 (사인파, 1시간 주기)
+        if time_variation:
+            wind_speed = wind_speed + 0.2 * speed * np.sin(2 * np.pi * times / 60)
+
+        # 난류 효과 추가 (가우시안 노이즈)
+        if turbulence:
+            normal = (np.random if rng is None else rng).normal
+            wind_speed = wind_speed + 0.1 * speed * normal(0, 1, times.shape)
+
+        # 풍속이 음수가 되지 않도록 보정
+        return np.maximum(wind_speed, 0.1)
+
     def calculate_wind_speeds(self, heights: np.ndarray, time: float = 0.0) -> np.ndarray:
         """
         여러 고도에서의 풍속을 계산합니다.
@@ -0,0 +1,30 @@
+"""
+시스템 시뮬레이션 엔진 패키지
+
+하위 모듈은 처음 접근할 때 불러옵니다 (PEP 562).
+"""
+import importlib
+
+# 공개 이름 -> 정의된 하위 모듈
+_LAZY_EXPORTS = {
+    "Pipeline": "pipeline",
+    "SimulationResult": "simulation_result",
+    "SweepQueue": "sweep",
+    "SweepSpec": "sweep",
+    "build_simulation_pipeline": "pipeline",
+}
+
+__all__ = sorted(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
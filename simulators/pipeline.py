@@ -0,0 +1,321 @@
+"""
+증분 재계산 파이프라인 모듈
+
+시뮬레이션을 단계(Stage)의 방향성 비순환 그래프(DAG)로 표현합니다.
+각 단계의 출력은 (단계가 사용하는 파라미터, 상위 단계 출력 키)로 만든 키로 캐시되므로,
+파라미터 하나를 바꾸면 그 파라미터에 의존하는 단계와 하위 단계만 다시 계산됩니다.
+
+풍속장, 공기 밀도 -> 전력 (지상형/AWE 시스템별 단계) -> 에너지 -> 그래프
+main.run_simulation도 이 파이프라인으로 실행되므로 기본 파라미터는 DEFAULT_PARAMS 한 곳에 있습니다.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from models.air_density import AirDensity
+from models.operating_envelope import OperatingEnvelope
+from models.specs import PowerSpec, compile_specs, load_config
+from models.wind_profile import WindProfile
+from simulators.simulation_result import SimulationResult
+from utils.memory import MemoryProfiler
+from utils.plotting import plot_results
+
+# 시스템 이름 (순서는 시스템별 난수 스트림 번호)
+_SYSTEMS = ("ground", "awe")
+
+
+def fingerprint(value: Any) -> Any:
+    """
+    캐시 키로 사용할 수 있는 해시 가능한 값으로 변환합니다.
+    배열은 dtype, 형태, 내용 해시로 표현합니다.
+
+    Args:
+        value: 파라미터 값
+
+    Returns:
+        해시 가능한 값
+    """
+    if isinstance(value, np.ndarray):
+        digest = hashlib.blake2b(np.ascontiguousarray(value).view(np.uint8), digest_size=16)
+        return ("ndarray", value.dtype.str, value.shape, digest.hexdigest())
+    if isinstance(value, dict):
+        return ("dict",) + tuple(sorted((key, fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(fingerprint(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return ("repr", repr(value))
+    return value
+
+
+class Stage:
+    """
+    파이프라인 단계 클래스
+    func는 선언한 파라미터와 상위 단계 출력을 키워드 인자로 받습니다.
+    """
+
+    def __init__(self, name: str, func: Callable[..., Any],
+                 inputs: Sequence[str] = (), params: Sequence[str] = ()):
+        """
+        초기화 함수
+
+        Args:
+            name: 단계 이름
+            func: 단계 계산 함수
+            inputs: 상위 단계 이름 목록
+            params: 단계가 사용하는 파라미터 이름 목록
+        """
+        self.name = name
+        self.func = func
+        self.inputs = tuple(inputs)
+        self.params = tuple(params)
+
+
+class Pipeline:
+    """
+    캐시를 사용하는 DAG 파이프라인 클래스
+    단계별로 최근 max_entries개의 출력을 보관하므로 파라미터를 이전 값으로 되돌리면
+    다시 계산하지 않고 캐시된 출력을 사용합니다.
+    recomputed에는 마지막 get 호출에서 다시 계산된 단계 이름만 계산 순서대로 남습니다.
+    """
+
+    def __init__(self, params: Optional[Dict[str, Any]] = None, max_entries: int = 4,
+                 profiler: Optional[MemoryProfiler] = None):
+        """
+        초기화 함수
+
+        Args:
+            params: 초기 파라미터
+            max_entries: 단계별 캐시 항목 수
+            profiler: 다시 계산되는 단계의 메모리 계측기 (None이면 계측하지 않음)
+        """
+        self.params: Dict[str, Any] = dict(params or {})
+        self.max_entries = int(max_entries)
+        self.profiler = profiler
+        self.stages: Dict[str, Stage] = {}
+        self.recomputed: List[str] = []
+        self._cache: Dict[str, OrderedDict] = {}
+
+    def add_stage(self, name: str, func: Callable[..., Any],
+                  inputs: Sequence[str] = (), params: Sequence[str] = ()) -> Stage:
+        """
+        단계를 추가합니다. 상위 단계는 먼저 추가되어 있어야 하므로 그래프는 항상 비순환입니다.
+
+        Args:
+            name: 단계 이름
+            func: 단계 계산 함수
+            inputs: 상위 단계 이름 목록
+            params: 단계가 사용하는 파라미터 이름 목록
+
+        Returns:
+            추가된 단계
+        """
+        if name in self.stages:
+            raise ValueError(f"이미 존재하는 단계입니다: {name}")
+        missing = [upstream for upstream in inputs if upstream not in self.stages]
+        if missing:
+            raise ValueError(f"상위 단계가 정의되지 않았습니다: {missing}")
+        stage = Stage(name, func, inputs, params)
+        self.stages[name] = stage
+        self._cache[name] = OrderedDict()
+        return stage
+
+    def set_params(self, **params: Any) -> None:
+        """
+        파라미터를 변경합니다.
+        기존 값과 새 값이 모두 딕셔너리이면 새 값을 기존 값에 병합합니다.
+        """
+        for name, value in params.items():
+            current = self.params.get(name)
+            if isinstance(current, dict) and isinstance(value, dict):
+                value = {**current, **value}
+            self.params[name] = value
+
+    def _key(self, stage: Stage, upstream_keys: Sequence[Any]) -> Any:
+        try:
+            values = tuple(fingerprint(self.params[name]) for name in stage.params)
+        except KeyError as error:
+            raise KeyError(f"단계 '{stage.name}'의 파라미터가 설정되지 않았습니다: {error}") from None
+        return (values, tuple(upstream_keys))
+
+    def _evaluate(self, name: str, keys: Dict[str, Any], outputs: Dict[str, Any]) -> None:
+        if name in keys:
+            return
+        stage = self.stages[name]
+        for upstream in stage.inputs:
+            self._evaluate(upstream, keys, outputs)
+
+        key = self._key(stage, [keys[upstream] for upstream in stage.inputs])
+        cache = self._cache[name]
+        if key in cache:
+            cache.move_to_end(key)
+        else:
+            kwargs = {param: self.params[param] for param in stage.params}
+            kwargs.update({upstream: outputs[upstream] for upstream in stage.inputs})
+            if self.profiler is None:
+                cache[key] = stage.func(**kwargs)
+            else:
+                with self.profiler.stage(name):
+                    cache[key] = stage.func(**kwargs)
+            self.recomputed.append(name)
+            while len(cache) > self.max_entries:
+                cache.popitem(last=False)
+        keys[name] = key
+        outputs[name] = cache[key]
+
+    def get(self, name: str) -> Any:
+        """
+        단계 출력을 반환합니다. 입력이 바뀐 단계만 다시 계산합니다.
+
+        Args:
+            name: 단계 이름
+
+        Returns:
+            단계 출력
+        """
+        if name not in self.stages:
+            raise KeyError(f"정의되지 않은 단계입니다: {name}")
+        self.recomputed = []
+        outputs: Dict[str, Any] = {}
+        self._evaluate(name, {}, outputs)
+        return outputs[name]
+
+    def clear_cache(self) -> None:
+        """모든 단계 캐시를 비웁니다."""
+        for cache in self._cache.values():
+            cache.clear()
+
+
+def _time_stage(duration: float, time_step: float) -> np.ndarray:
+    return np.arange(0, duration, time_step)
+
+
+def _wind_field_stage(system: str):
+    height_parameter = f"{system}_height"
+    stream = _SYSTEMS.index(system)
+
+    def compute(wind_profile: Dict[str, Any], seed: int, time: np.ndarray,
+                **params: Any) -> np.ndarray:
+        # 시스템별 독립 난수 스트림: 한 시스템의 고도를 바꿔도 다른 시스템의 난류는 그대로
+        rng = np.random.default_rng(np.random.SeedSequence(seed).spawn(len(_SYSTEMS))[stream])
+        profile = WindProfile(**wind_profile)
+        return profile.calculate_wind_speed_series(params[height_parameter], time, rng=rng)
+
+    return compute
+
+
+def _density_stage(system: str):
+    height_parameter = f"{system}_height"
+
+    def compute(air_density: Dict[str, Any], time: np.ndarray, **params: Any) -> np.ndarray:
+        model = AirDensity(**air_density)
+        return np.full(time.shape, model.calculate_density(params[height_parameter]))
+
+    return compute
+
+
+def _power_stage(system: str, profiler: Optional[MemoryProfiler]):
+    parameter = f"{system}_calculator"
+    envelope_parameter = f"{system}_envelope"
+    wind_input = f"{system}_wind_field"
+    density_input = f"{system}_density"
+
+    def compute(time_step: float, **params: Any) -> np.ndarray:
+        wind_speed = params[wind_input]
+        spec = PowerSpec(**params[parameter])
+        if profiler is None:
+            power = spec.power(wind_speed, params[density_input])
+        else:
+            # 예산 초과 시 분할 계산 (운전 범위는 시계열 상태에 의존하므로 전체에 적용)
+            power = profiler.map_chunked(f"{system}_spec.power", spec.power,
+                                         wind_speed, params[density_input])
+        envelope = params[envelope_parameter]
+        if envelope is None:
+            return power
+        return OperatingEnvelope(**envelope).apply(wind_speed, power, time_step)
+
+    return compute
+
+
+def _energy_stage(time_step: float, start_time: Optional[str], time: np.ndarray,
+                  **outputs: np.ndarray) -> SimulationResult:
+    series = {}
+    for system in _SYSTEMS:
+        series[f"{system}_wind_speed"] = outputs[f"{system}_wind_field"]
+        series[f"{system}_air_density"] = outputs[f"{system}_density"]
+        series[f"{system}_power"] = outputs[f"{system}_power"]
+    return SimulationResult(time, time_step, series, start_time=start_time)
+
+
+def _plots_stage(duration: float, energy: SimulationResult) -> SimulationResult:
+    plot_results(energy, duration)
+    return energy
+
+
+# main.run_simulation과 build_simulation_pipeline의 기본 파라미터
+# 시작 시각(start_time, config.yaml의 simulation.start_date)과
+# 운전 범위(ground_envelope / awe_envelope)는 build_simulation_pipeline에서 config.yaml로부터 채움
+DEFAULT_PARAMS = {
+    "duration": 10,  # 분
+    "time_step": 1,  # 분
+    "seed": 0,
+    "ground_height": 80.0,
+    "awe_height": 300.0,
+    "wind_profile": {"reference_height": 10, "reference_speed": 4.0, "power_law_exponent": 0.2},
+    "air_density": {},
+    # 전력 모델 인자 (PowerSpec 생성자 인자)
+    "ground_calculator": {"power_coefficient": 0.4, "area": 100.0,
+                          "cycle_efficiency": 0.9, "system_type": "ground"},
+    "awe_calculator": {"power_coefficient": 0.4, "area": 50.0, "cycle_efficiency": 0.85,
+                       "system_type": "awe", "lift_coefficient": 1.2, "drag_coefficient": 0.1,
+                       "tether_drag_coefficient": 0.2, "tether_length": 350.0},
+}
+
+
+def build_simulation_pipeline(profiler: Optional[MemoryProfiler] = None,
+                              **params: Any) -> Pipeline:
+    """
+    풍력 발전 비교 시뮬레이션 파이프라인을 만듭니다.
+
+    단계 (시스템별로 분리되어 한 시스템의 파라미터 변경은 다른 시스템을 다시 계산하지 않음):
+        time -> {ground,awe}_wind_field, {ground,awe}_density -> {ground,awe}_power
+             -> energy -> plots
+    "energy" 단계 출력은 SimulationResult이며, "plots"는 그래프를 저장/표시합니다.
+
+    Args:
+        profiler: 단계별 메모리 계측기 (None이면 계측하지 않음)
+        params: DEFAULT_PARAMS와 config.yaml 운전 범위를 덮어쓸 파라미터 (딕셔너리 값은 병합)
+                ground_envelope / awe_envelope를 None으로 주면 운전 범위를 적용하지 않습니다.
+
+    Returns:
+        Pipeline
+    """
+    defaults = {key: dict(value) if isinstance(value, dict) else value
+                for key, value in DEFAULT_PARAMS.items()}
+    config = load_config()
+    specs = compile_specs(config)
+    defaults["start_time"] = config.get("simulation", {}).get("start_date")
+    defaults["ground_envelope"] = OperatingEnvelope.spec_arguments(specs["ground_turbine"])
+    defaults["awe_envelope"] = OperatingEnvelope.spec_arguments(specs["awe_system"])
+
+    pipeline = Pipeline(defaults, profiler=profiler)
+    pipeline.set_params(**params)
+
+    pipeline.add_stage("time", _time_stage, params=("duration", "time_step"))
+    energy_inputs = ["time"]
+    for system in _SYSTEMS:
+        stages = (f"{system}_wind_field", f"{system}_density", f"{system}_power")
+        pipeline.add_stage(stages[0], _wind_field_stage(system), inputs=("time",),
+                           params=("wind_profile", "seed", f"{system}_height"))
+        pipeline.add_stage(stages[1], _density_stage(system), inputs=("time",),
+                           params=("air_density", f"{system}_height"))
+        pipeline.add_stage(stages[2], _power_stage(system, profiler), inputs=stages[:2],
+                           params=("time_step", f"{system}_calculator", f"{system}_envelope"))
+        energy_inputs.extend(stages)
+    pipeline.add_stage("energy", _energy_stage, inputs=energy_inputs,
+                       params=("time_step", "start_time"))
+    pipeline.add_stage("plots", _plots_stage, inputs=("energy",), params=("duration",))
+    return pipeline
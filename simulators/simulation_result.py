@@ -0,0 +1,248 @@
+import numpy as np
+from typing import Dict, Optional, Tuple, Union
+
+# 달력 단위 리샘플링 별칭 -> numpy datetime64 단위
+_CALENDAR_UNITS = {
+    "hour": "h",
+    "day": "D",
+    "month": "M",
+    "year": "Y",
+}
+
+# 구간 축약 함수 (reduceat 지원 ufunc)
+_SEGMENT_REDUCERS = {
+    "sum": np.add,
+    "max": np.maximum,
+    "min": np.minimum,
+}
+
+
+class SimulationResult:
+    """
+    시뮬레이션 시계열 결과를 보관하는 클래스
+    집계(리샘플링, 이동 통계, 지속 곡선)는 요청 시점에 지연 계산되며
+    한 번 계산된 결과는 캐시되어 반복 조회 시 즉시 반환됩니다.
+    기본 배열은 복사하지 않고 읽기 전용 뷰로만 보관합니다.
+    """
+
+    def __init__(self, time: np.ndarray, time_step: float,
+                 series: Dict[str, np.ndarray],
+                 start_time: Optional[Union[str, np.datetime64]] = None):
+        """
+        초기화 함수
+
+        Args:
+            time: 시간 배열 (분), 오름차순
+            time_step: 시간 간격 (분)
+            series: 이름 -> 시계열 배열 딕셔너리 (길이는 time과 동일)
+            start_time: 시뮬레이션 시작 시각 (달력 단위 리샘플링에 사용)
+        """
+        self.time = self._readonly(time)
+        self.time_step = float(time_step)
+        self.start_time = None if start_time is None else np.datetime64(start_time, "m")
+
+        self._series = {}
+        for name, values in series.items():
+            values = self._readonly(values)
+            if values.shape[0] != self.time.shape[0]:
+                raise ValueError(f"시계열 '{name}'의 길이가 시간 배열과 다릅니다: "
+                                 f"{values.shape[0]} != {self.time.shape[0]}")
+            self._series[name] = values
+
+        self._cache = {}
+
+    @staticmethod
+    def _readonly(values: np.ndarray) -> np.ndarray:
+        """복사 없이 읽기 전용 뷰를 반환합니다."""
+        view = np.asarray(values).view()
+        view.flags.writeable = False
+        return view
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._series[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._series
+
+    def __len__(self) -> int:
+        return self.time.shape[0]
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """보관 중인 시계열 이름 목록"""
+        return tuple(self._series)
+
+    def _cached(self, key: tuple, compute):
+        """캐시된 값을 반환하거나, 없으면 계산 후 읽기 전용으로 저장합니다."""
+        if key not in self._cache:
+            value = compute()
+            if isinstance(value, tuple):
+                value = tuple(self._readonly(v) for v in value)
+            else:
+                value = self._readonly(value)
+            self._cache[key] = value
+        return self._cache[key]
+
+    def clear_cache(self) -> None:
+        """계산된 집계 캐시를 비웁니다."""
+        self._cache.clear()
+
+    def segment_starts(self, interval: Union[float, str]) -> np.ndarray:
+        """
+        리샘플링 구간의 시작 인덱스를 계산합니다.
+
+        Args:
+            interval: 구간 길이 (분) 또는 달력 단위 ("hour", "day", "month", "year")
+
+        Returns:
+            각 구간의 시작 인덱스 배열
+        """
+        return self._cached(("segments", interval), lambda: self._segment_starts(interval))
+
+    def _segment_starts(self, interval: Union[float, str]) -> np.ndarray:
+        if isinstance(interval, str):
+            if interval not in _CALENDAR_UNITS:
+                raise ValueError(f"지원하지 않는 리샘플링 단위입니다: {interval}")
+            if self.start_time is None:
+                raise ValueError("달력 단위 리샘플링에는 start_time이 필요합니다.")
+        elif interval <= 0:
+            raise ValueError("리샘플링 간격은 양수여야 합니다.")
+
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.intp)
+        if isinstance(interval, str):
+            timestamps = self.start_time + np.round(self.time).astype("timedelta64[m]")
+            labels = timestamps.astype(f"datetime64[{_CALENDAR_UNITS[interval]}]")
+        else:
+            labels = np.floor((self.time - self.time[0]) / float(interval)).astype(np.int64)
+
+        changed = np.empty(labels.shape[0], dtype=bool)
+        changed[0] = True
+        np.not_equal(labels[1:], labels[:-1], out=changed[1:])
+        return np.flatnonzero(changed)
+
+    def resample(self, name: str, interval: Union[float, str],
+                 how: str = "mean") -> Tuple[np.ndarray, np.ndarray]:
+        """
+        시계열을 더 큰 시간 간격으로 리샘플링합니다.
+        구간 축약은 reduceat을 사용하여 한 번에 계산됩니다.
+
+        Args:
+            name: 시계열 이름
+            interval: 구간 길이 (분) 또는 달력 단위 ("hour", "day", "month", "year")
+            how: 축약 방법 ("mean", "sum", "max", "min", "energy")
+                 "energy"는 전력(kW)을 구간별 에너지(kWh)로 적분합니다.
+
+        Returns:
+            (구간 시작 시간 배열, 구간별 값 배열) 튜플
+        """
+        if how not in ("mean", "energy") and how not in _SEGMENT_REDUCERS:
+            raise ValueError(f"지원하지 않는 축약 방법입니다: {how}")
+        values = self._series[name]
+
+        def compute():
+            starts = self.segment_starts(interval)
+            if starts.shape[0] == 0:
+                return self.time[:0], values[:0]
+            if how in _SEGMENT_REDUCERS:
+                reduced = _SEGMENT_REDUCERS[how].reduceat(values, starts, axis=0)
+            else:
+                reduced = np.add.reduceat(values, starts, axis=0, dtype=float)
+                if how == "mean":
+                    counts = np.diff(np.append(starts, values.shape[0]))
+                    reduced /= counts.reshape((-1,) + (1,) * (values.ndim - 1))
+                else:
+                    reduced *= self.time_step / 60  # 분 -> 시간 변환
+            return self.time[starts], reduced
+
+        return self._cached(("resample", name, interval, how), compute)
+
+    def rolling(self, name: str, window: int, stat: str = "mean") -> np.ndarray:
+        """
+        이동 창 통계를 계산합니다.
+        결과 길이는 len(series) - window + 1 입니다.
+
+        Args:
+            name: 시계열 이름
+            window: 창 크기 (샘플 수)
+            stat: 통계 종류 ("mean", "sum", "std", "max", "min")
+
+        Returns:
+            이동 통계 배열
+        """
+        if stat not in ("mean", "sum", "std", "max", "min"):
+            raise ValueError(f"지원하지 않는 이동 통계입니다: {stat}")
+        values = self._series[name]
+        window = int(window)
+        if not 1 <= window <= values.shape[0]:
+            raise ValueError("창 크기는 1 이상, 시계열 길이 이하여야 합니다.")
+
+        def compute():
+            if stat in ("max", "min"):
+                windows = np.lib.stride_tricks.sliding_window_view(values, window, axis=0)
+                return windows.max(axis=-1) if stat == "max" else windows.min(axis=-1)
+
+            sums = self._window_sums(values, window)
+            if stat == "sum":
+                return sums
+            means = sums / window
+            if stat == "mean":
+                return means
+            squares = self._window_sums(np.square(values, dtype=float), window)
+            return np.sqrt(np.maximum(squares / window - means**2, 0.0))
+
+        return self._cached(("rolling", name, window, stat), compute)
+
+    @staticmethod
+    def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+        """누적합을 이용해 창 합계를 계산합니다."""
+        cumulative = np.cumsum(values, axis=0, dtype=float)
+        sums = cumulative[window - 1:].copy()
+        sums[1:] -= cumulative[:-window]
+        return sums
+
+    def duration_curve(self, name: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        지속 곡선(내림차순 정렬 값과 초과 확률)을 계산합니다.
+
+        Args:
+            name: 시계열 이름
+
+        Returns:
+            (초과 확률 배열 [0, 1], 내림차순 정렬 값 배열) 튜플
+        """
+        values = self._series[name]
+
+        def compute():
+            ordered = np.sort(values, axis=0)[::-1]
+            n = ordered.shape[0]
+            exceedance = np.arange(1, n + 1) / n
+            return exceedance, ordered
+
+        return self._cached(("duration_curve", name), compute)
+
+    def cumulative_energy(self, name: str) -> np.ndarray:
+        """
+        전력(kW) 시계열의 누적 에너지(kWh)를 계산합니다.
+
+        Args:
+            name: 전력 시계열 이름
+
+        Returns:
+            누적 에너지 배열 (kWh)
+        """
+        return self._cached(("cumulative_energy", name),
+                            lambda: np.cumsum(self._series[name] * (self.time_step / 60), axis=0))
+
+    def total_energy(self, name: str) -> float:
+        """
+        전력(kW) 시계열의 총 에너지(kWh)를 계산합니다.
+
+        Args:
+            name: 전력 시계열 이름
+
+        Returns:
+            총 에너지 (kWh)
+        """
+        cumulative = self.cumulative_energy(name)
+        return float(cumulative[-1]) if cumulative.shape[0] else 0.0
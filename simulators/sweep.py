@@ -0,0 +1,438 @@
+"""
+샤딩된 설계 스윕 실행 모듈
+
+PowerSpec / WindProfileSpec 파라미터 격자를 독립적인 작업 단위(샤드)로 나누고,
+디렉터리 기반 큐를 통해 여러 작업 프로세스가 샤드를 가져가 처리합니다.
+
+큐 디렉터리 구조:
+    spec.json       스윕 정의
+    pending/        처리 대기 샤드
+    claimed/        작업 중인 샤드 (파일 수정 시각 = 마지막 하트비트)
+    results/        완료된 샤드별 부분 결과 (.npz)
+
+샤드 결과는 입력에 대해 결정적이므로, 중단된 작업을 다른 작업자가 다시 처리해도
+병합 결과는 동일합니다. 작업자는 실행 중 언제든 추가로 참여할 수 있습니다.
+"""
+import argparse
+import functools
+import json
+import os
+import socket
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from models.specs import PowerSpec, WindProfileSpec, load_specs
+
+# 파라미터 이름 접두사 -> 대상 모델
+_TARGETS = ("wind_profile", "power")
+
+
+_SHARD_FORMAT = "shard-{:06d}"
+
+
+class SweepSpec:
+    """
+    설계 스윕 정의 클래스
+    파라미터 이름은 "wind_profile.<인자>" 또는 "power.<인자>" 형식이며,
+    격자의 모든 조합을 정해진 순서(itertools.product)로 열거합니다.
+    """
+
+    def __init__(self, grid: Dict[str, Sequence[Any]],
+                 fixed: Optional[Dict[str, Any]] = None,
+                 height: float = 300.0,
+                 shard_size: int = 64):
+        """
+        초기화 함수
+
+        Args:
+            grid: 파라미터 이름 -> 후보 값 목록
+            fixed: 모든 조합에 공통으로 적용할 파라미터
+            height: 평가 고도 (m)
+            shard_size: 샤드당 조합 수
+        """
+        for name in list(grid) + list(fixed or {}):
+            target = name.split(".", 1)[0]
+            if "." not in name or target not in _TARGETS:
+                raise ValueError(f"파라미터 이름은 'wind_profile.' 또는 'power.'로 시작해야 합니다: {name}")
+        if shard_size < 1:
+            raise ValueError("샤드 크기는 1 이상이어야 합니다.")
+
+        self.grid = {name: list(values) for name, values in grid.items()}
+        self.fixed = dict(fixed or {})
+        self.height = float(height)
+        self.shard_size = int(shard_size)
+
+    @property
+    def parameter_names(self) -> List[str]:
+        return list(self.grid)
+
+    @property
+    def n_points(self) -> int:
+        return int(np.prod([len(values) for values in self.grid.values()], dtype=np.int64))
+
+    @property
+    def n_shards(self) -> int:
+        return -(-self.n_points // self.shard_size)
+
+    def point(self, index: int) -> Dict[str, Any]:
+        """조합 인덱스에 해당하는 파라미터 딕셔너리를 반환합니다 (행 우선 순서)."""
+        params = dict(self.fixed)
+        for name, values in reversed(list(self.grid.items())):
+            index, position = divmod(index, len(values))
+            params[name] = values[position]
+        return params
+
+    def shard_range(self, shard_id: int) -> range:
+        """샤드에 속한 조합 인덱스 범위를 반환합니다."""
+        start = shard_id * self.shard_size
+        return range(start, min(start + self.shard_size, self.n_points))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"grid": self.grid, "fixed": self.fixed,
+                "height": self.height, "shard_size": self.shard_size}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SweepSpec":
+        return cls(data["grid"], data.get("fixed"), data["height"], data["shard_size"])
+
+
+@functools.lru_cache(maxsize=None)
+def _config_specs() -> Dict[str, Any]:
+    """config.yaml의 명세를 작업 프로세스당 한 번만 읽습니다."""
+    return load_specs()
+
+
+def evaluate_point(params: Dict[str, Any], height: float) -> Dict[str, float]:
+    """
+    한 파라미터 조합의 평균 풍속, 공기 밀도, 전력을 계산합니다.
+    파생 상수는 조합마다 불변 명세(WindProfileSpec, PowerSpec)로 한 번만 계산됩니다.
+    풍속 프로파일의 지정하지 않은 인자와 공기 밀도는 config.yaml 값을 사용합니다.
+
+    Args:
+        params: "wind_profile.<인자>" / "power.<인자>" 파라미터 딕셔너리
+                (각각 WindProfileSpec / PowerSpec 생성자 인자)
+        height: 평가 고도 (m)
+
+    Returns:
+        평가 결과 딕셔너리 (wind_speed, air_density, power)
+    """
+    kwargs = {target: {} for target in _TARGETS}
+    for name, value in params.items():
+        target, argument = name.split(".", 1)
+        kwargs[target][argument] = value
+
+    specs = _config_specs()
+    wind_kwargs = specs["wind_profile"].to_dict()
+    wind_kwargs.update(kwargs["wind_profile"])
+    wind_profile = WindProfileSpec(**wind_kwargs)
+    power_spec = PowerSpec(**kwargs["power"])
+
+    wind_speed = float(wind_profile.mean_wind_speed(height))
+    air_density = float(specs["air_density"].density(height))
+    power = float(power_spec.power(wind_speed, air_density))
+    return {"wind_speed": wind_speed, "air_density": air_density, "power": power}
+
+
+def evaluate_shard(spec: SweepSpec, shard_id: int,
+                   heartbeat: Optional[Callable[[], None]] = None) -> Dict[str, np.ndarray]:
+    """
+    샤드 하나를 평가하여 부분 결과 배열을 반환합니다.
+
+    Args:
+        spec: 스윕 정의
+        shard_id: 샤드 번호
+        heartbeat: 조합 하나를 평가할 때마다 호출할 함수 (작업 중 하트비트 갱신용)
+
+    Returns:
+        index 및 평가 결과 열 배열 딕셔너리
+    """
+    indices = spec.shard_range(shard_id)
+    rows = []
+    for i in indices:
+        rows.append(evaluate_point(spec.point(i), spec.height))
+        if heartbeat is not None:
+            heartbeat()
+    columns = {"index": np.asarray(indices, dtype=np.int64)}
+    for key in ("wind_speed", "air_density", "power"):
+        columns[key] = np.array([row[key] for row in rows], dtype=float)
+    return columns
+
+
+class SweepQueue:
+    """
+    디렉터리 기반 작업 큐 클래스
+    샤드 획득은 원자적 rename으로 이루어지므로 여러 프로세스가
+    동시에 큐를 비워도 한 샤드를 한 작업자만 획득합니다.
+    """
+
+    def __init__(self, root: os.PathLike):
+        """
+        초기화 함수
+
+        Args:
+            root: 큐 디렉터리 경로
+        """
+        self.root = Path(root)
+        self.pending_dir = self.root / "pending"
+        self.claimed_dir = self.root / "claimed"
+        self.results_dir = self.root / "results"
+
+    def submit(self, spec: SweepSpec) -> int:
+        """
+        스윕을 큐에 등록합니다. 이미 완료되었거나 대기/작업 중인 샤드는 건너뛰므로
+        같은 스윕을 다시 등록하면 남은 샤드만 재개됩니다.
+
+        Args:
+            spec: 스윕 정의
+
+        Returns:
+            새로 등록된 샤드 수
+        """
+        for directory in (self.pending_dir, self.claimed_dir, self.results_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        spec_path = self.root / "spec.json"
+        if spec_path.exists():
+            if json.loads(spec_path.read_text()) != json.loads(json.dumps(spec.to_dict())):
+                raise ValueError(f"큐에 다른 스윕이 이미 등록되어 있습니다: {self.root}")
+        else:
+            self._write_atomic(spec_path, json.dumps(spec.to_dict()).encode())
+
+        queued = {path.name.split(".", 1)[0]
+                  for directory in (self.pending_dir, self.claimed_dir, self.results_dir)
+                  for path in directory.iterdir()}
+        submitted = 0
+        for shard_id in range(spec.n_shards):
+            name = _SHARD_FORMAT.format(shard_id)
+            if name not in queued:
+                (self.pending_dir / name).touch()
+                submitted += 1
+        return submitted
+
+    def load_spec(self) -> SweepSpec:
+        return SweepSpec.from_dict(json.loads((self.root / "spec.json").read_text()))
+
+    def claim(self, worker_id: str, stale_after: Optional[float] = None) -> Optional[int]:
+        """
+        대기 중인 샤드 하나를 획득합니다. 대기 샤드가 없으면
+        하트비트가 stale_after초 이상 끊긴 샤드를 다시 대기열로 돌려 획득합니다.
+
+        Args:
+            worker_id: 작업자 식별자
+            stale_after: 중단된 작업으로 간주할 하트비트 경과 시간 (초)
+
+        Returns:
+            획득한 샤드 번호 (남은 샤드가 없으면 None)
+        """
+        shard_id = self._claim_pending(worker_id)
+        if shard_id is None and stale_after is not None and self.requeue_stale(stale_after):
+            shard_id = self._claim_pending(worker_id)
+        return shard_id
+
+    def _claim_pending(self, worker_id: str) -> Optional[int]:
+        # 작업자마다 다른 위치에서 탐색을 시작해 rename 경합을 줄입니다
+        names = sorted(path.name for path in self.pending_dir.iterdir())
+        if not names:
+            return None
+        offset = hash(worker_id) % len(names)
+        for name in names[offset:] + names[:offset]:
+            pending = self.pending_dir / name
+            claimed = self.claimed_dir / f"{name}.{worker_id}"
+            try:
+                # rename은 수정 시각을 유지하므로 먼저 갱신해야, 제출 시각이 오래된 샤드를
+                # 획득하자마자 다른 작업자의 requeue_stale이 되돌리지 않습니다
+                os.utime(pending)
+                os.rename(pending, claimed)
+            except FileNotFoundError:
+                continue  # 다른 작업자가 먼저 획득
+            return int(name.rsplit("-", 1)[1])
+        return None
+
+    def heartbeat(self, shard_id: int, worker_id: str) -> None:
+        """작업 중인 샤드의 하트비트를 갱신합니다."""
+        claimed = self.claimed_dir / f"{_SHARD_FORMAT.format(shard_id)}.{worker_id}"
+        try:
+            os.utime(claimed)
+        except FileNotFoundError:
+            pass  # 다른 작업자가 넘겨받은 샤드, 결과가 같으므로 계속 진행
+
+    def requeue_stale(self, stale_after: float) -> int:
+        """
+        하트비트가 끊긴 샤드를 대기열로 되돌립니다.
+
+        Args:
+            stale_after: 중단된 작업으로 간주할 하트비트 경과 시간 (초)
+
+        Returns:
+            되돌린 샤드 수
+        """
+        now = time.time()
+        requeued = 0
+        for path in self.claimed_dir.iterdir():
+            name = path.name.split(".", 1)[0]
+            try:
+                if now - path.stat().st_mtime < stale_after:
+                    continue
+                if (self.results_dir / f"{name}.npz").exists():
+                    path.unlink()
+                    continue
+                os.rename(path, self.pending_dir / name)
+                requeued += 1
+            except FileNotFoundError:
+                continue  # 그 사이 완료되었거나 다른 작업자가 처리
+        return requeued
+
+    def complete(self, shard_id: int, worker_id: str, columns: Dict[str, np.ndarray]) -> None:
+        """
+        샤드의 부분 결과를 원자적으로 기록하고 획득 표시를 제거합니다.
+
+        Args:
+            shard_id: 샤드 번호
+            worker_id: 작업자 식별자
+            columns: 부분 결과 열 배열
+        """
+        name = _SHARD_FORMAT.format(shard_id)
+        temporary = self.results_dir / f".{name}.{worker_id}.tmp.npz"
+        np.savez(temporary, **columns)
+        os.replace(temporary, self.results_dir / f"{name}.npz")
+        try:
+            (self.claimed_dir / f"{name}.{worker_id}").unlink()
+        except FileNotFoundError:
+            pass
+
+    def completed_shards(self) -> List[int]:
+        return sorted(int(path.stem.rsplit("-", 1)[1])
+                      for path in self.results_dir.glob("shard-*.npz"))
+
+    def is_done(self) -> bool:
+        return len(self.completed_shards()) == self.load_spec().n_shards
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        temporary = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        temporary.write_bytes(data)
+        os.replace(temporary, path)
+
+
+def default_worker_id() -> str:
+    """호스트 이름과 프로세스 번호로 작업자 식별자를 만듭니다."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def run_worker(root: os.PathLike, worker_id: Optional[str] = None,
+               stale_after: Optional[float] = 600.0,
+               max_shards: Optional[int] = None) -> int:
+    """
+    큐가 빌 때까지 샤드를 가져와 처리합니다.
+    샤드를 평가하는 동안 조합마다 하트비트를 갱신하므로, 오래 걸리는 샤드도
+    stale_after보다 긴 처리 시간 때문에 다른 작업자에게 회수되지 않습니다.
+
+    Args:
+        root: 큐 디렉터리 경로
+        worker_id: 작업자 식별자 (기본값: 호스트-프로세스 번호)
+        stale_after: 중단된 작업으로 간주할 하트비트 경과 시간 (초), None이면 회수하지 않음
+        max_shards: 처리할 최대 샤드 수
+
+    Returns:
+        처리한 샤드 수
+    """
+    queue = SweepQueue(root)
+    spec = queue.load_spec()
+    worker_id = worker_id or default_worker_id()
+
+    processed = 0
+    while max_shards is None or processed < max_shards:
+        shard_id = queue.claim(worker_id, stale_after)
+        if shard_id is None:
+            break
+        columns = evaluate_shard(spec, shard_id,
+                                 heartbeat=lambda: queue.heartbeat(shard_id, worker_id))
+        queue.complete(shard_id, worker_id, columns)
+        processed += 1
+    return processed
+
+
+def merge_results(root: os.PathLike, require_complete: bool = True) -> Dict[str, np.ndarray]:
+    """
+    샤드별 부분 결과를 조합 인덱스 순서로 병합합니다.
+    병합 순서는 샤드 번호로만 결정되므로 작업자 수나 처리 순서와 무관합니다.
+
+    Args:
+        root: 큐 디렉터리 경로
+        require_complete: 모든 샤드가 완료되지 않았으면 오류를 발생시킬지 여부
+
+    Returns:
+        파라미터 열과 평가 결과 열 배열 딕셔너리
+    """
+    queue = SweepQueue(root)
+    spec = queue.load_spec()
+    shard_ids = queue.completed_shards()
+    if require_complete and len(shard_ids) != spec.n_shards:
+        missing = sorted(set(range(spec.n_shards)) - set(shard_ids))
+        raise RuntimeError(f"완료되지 않은 샤드가 있습니다: {missing[:10]}")
+
+    parts = []
+    for shard_id in shard_ids:
+        with np.load(queue.results_dir / f"{_SHARD_FORMAT.format(shard_id)}.npz") as data:
+            parts.append({key: data[key] for key in data.files})
+
+    keys = ("index", "wind_speed", "air_density", "power")
+    merged = {key: np.concatenate([part[key] for part in parts]) if parts
+              else np.zeros(0, dtype=np.int64 if key == "index" else float)
+              for key in keys}
+    shape = tuple(len(values) for values in spec.grid.values())
+    positions = np.unravel_index(merged["index"], shape) if shape else ()
+    for name, position in zip(spec.parameter_names, positions):
+        merged[name] = np.asarray(spec.grid[name])[position]
+    return merged
+
+
+def run_sweep(spec: SweepSpec, root: os.PathLike, n_workers: int = 1,
+              stale_after: Optional[float] = 600.0) -> Dict[str, np.ndarray]:
+    """
+    스윕을 등록하고 로컬 작업자 프로세스로 처리한 뒤 결과를 병합합니다.
+
+    Args:
+        spec: 스윕 정의
+        root: 큐 디렉터리 경로
+        n_workers: 로컬 작업자 프로세스 수 (1이면 현재 프로세스에서 처리)
+        stale_after: 중단된 작업으로 간주할 하트비트 경과 시간 (초)
+
+    Returns:
+        병합된 결과 (merge_results 참조)
+    """
+    SweepQueue(root).submit(spec)
+    if n_workers <= 1:
+        run_worker(root, stale_after=stale_after)
+    else:
+        import multiprocessing
+
+        workers = [multiprocessing.Process(target=run_worker, args=(os.fspath(root),),
+                                           kwargs={"stale_after": stale_after})
+                   for _ in range(n_workers)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+    return merge_results(root)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """명령행 진입점: 기존 큐에 작업자를 추가로 참여시킵니다."""
+    parser = argparse.ArgumentParser(description="설계 스윕 큐 작업자")
+    parser.add_argument("root", help="큐 디렉터리 경로")
+    parser.add_argument("--stale-after", type=float, default=600.0,
+                        help="중단된 작업으로 간주할 하트비트 경과 시간 (초)")
+    parser.add_argument("--max-shards", type=int, default=None, help="처리할 최대 샤드 수")
+    args = parser.parse_args(argv)
+
+    processed = run_worker(args.root, stale_after=args.stale_after, max_shards=args.max_shards)
+    print(f"처리한 샤드 수: {processed}")
+
+
+if __name__ == "__main__":
+    main()
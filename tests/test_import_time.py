@@ -0,0 +1,69 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# 기본 임포트 경로에서 불러오면 안 되는 무거운 의존성
+HEAVY_MODULES = ("matplotlib", "pandas", "scipy", "yaml")
+
+# 프로젝트 모듈 자체 임포트 시간 예산 (마이크로초, numpy 등 외부 모듈 제외)
+PROJECT_IMPORT_BUDGET_US = 50_000
+
+PROJECT_PACKAGES = ("main", "models", "simulators", "utils")
+
+
+def _import_times(statement):
+    """python -X importtime 출력을 {모듈: (self_us, cumulative_us)}로 파싱합니다."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # 헤더 행
+        times[module.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+
+@pytest.mark.parametrize("statement", [
+    "import main",
+    "import models",
+    "from models import PowerCalculator, WindProfile, AirDensity",
+    "from simulators import SimulationResult",
+])
+def test_no_heavy_imports(statement):
+    """기본 경로에서 무거운 의존성을 불러오지 않는지 테스트"""
+    times = _import_times(statement)
+    loaded = {name.split(".")[0] for name in times}
+    assert not loaded & set(HEAVY_MODULES)
+
+
+def test_import_time_budget():
+    """프로젝트 모듈 임포트 시간 예산 테스트"""
+    times = _import_times("import main")
+    project_self_us = sum(
+        self_us for module, (self_us, _) in times.items()
+        if module.split(".")[0] in PROJECT_PACKAGES
+    )
+    assert project_self_us < PROJECT_IMPORT_BUDGET_US
+
+
+def test_lazy_package_exports():
+    """패키지 지연 공개 이름 테스트"""
+    import models
+    import simulators
+    from models.power_calc import PowerCalculator
+    from simulators.simulation_result import SimulationResult
+
+    assert models.PowerCalculator is PowerCalculator
+    assert simulators.SimulationResult is SimulationResult
+    assert "WindProfile" in dir(models)
+    with pytest.raises(AttributeError):
+        models.DoesNotExist
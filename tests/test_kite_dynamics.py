@@ -0,0 +1,85 @@
+import pytest
+import numpy as np
+from models.power_calc import PowerCalculator
+from models.kite_dynamics import PumpingCycleModel, integrate_adaptive
+
+@pytest.fixture
+def model():
+    """테스트용 AWE 펌핑 사이클 모델"""
+    calculator = PowerCalculator(area=50.0, cycle_efficiency=0.85, system_type="awe")
+    return PumpingCycleModel(calculator)
+
+def test_integrate_adaptive_accuracy():
+    """적응형 적분기 정확도 및 종료 조건 테스트"""
+    result = integrate_adaptive(lambda t, y: -y, np.array([1.0]), 5.0, rtol=1e-8, atol=1e-10)
+    assert np.isclose(result["t"][-1], 5.0)
+    assert np.isclose(result["y"][-1, 0], np.exp(-5.0), rtol=1e-6)
+
+    # y = t 가 2에 도달하면 종료
+    result = integrate_adaptive(lambda t, y: np.array([1.0]), np.array([0.0]), 10.0,
+                                event=lambda y: y[0] - 2.0)
+    assert result["terminated"]
+    assert np.isclose(result["t"][-1], 2.0, atol=1e-5)
+
+def test_adaptive_steps(model):
+    """정상 구간에서는 큰 스텝, 전환 구간에서는 작은 스텝을 사용하는지 테스트"""
+    result = model.simulate_cycle(10.0)
+    steps = np.diff(result["t"])
+
+    assert result["feasible"]
+    assert steps.max() > 50 * steps.min()
+    # 최소 스텝으로 고정 적분했을 때보다 훨씬 적은 스텝 수
+    assert result["n_steps"] < result["cycle_time"] / steps.min() / 10
+
+def test_cycle_physics(model):
+    """사이클 물리량 테스트"""
+    result = model.simulate_cycle(10.0)
+
+    assert np.isclose(result["tether_length"][0], model.min_tether_length, atol=1e-3)
+    reel_out_end = np.searchsorted(result["t"], result["reel_out_time"])
+    assert np.isclose(result["tether_length"][reel_out_end], model.max_tether_length, atol=1e-3)
+    assert result["reel_out_energy"] > 0
+    assert result["reel_in_energy"] < 0
+    assert result["cycle_power"] > 0
+    assert np.all(result["tension"] >= 0)
+
+    # 정상 릴아웃 전력은 준정상 공식과 일치
+    reel_out_power = result["reel_out_energy"] * 3600 / result["reel_out_time"]
+    quasi_steady = model.calculator.calculate_power(10.0, 1.225, theta=model.theta)[0]
+    assert np.isclose(reel_out_power, quasi_steady / model.calculator.cycle_efficiency, rtol=0.02)
+
+def test_cycle_power_increases_with_wind(model):
+    """풍속 증가에 따른 사이클 전력 증가 테스트"""
+    powers = [model.simulate_cycle(v)["cycle_power"] for v in (4.0, 8.0, 12.0)]
+    assert np.all(np.diff(powers) > 0)
+
+def test_calculate_power_cache(model):
+    """시계열 전력 계산과 캐시 테스트"""
+    wind_speeds = np.array([9.9, 10.0, 10.05, 12.0, 0.5])
+    power = model.calculate_power(wind_speeds, 1.225)
+
+    assert power.shape == wind_speeds.shape
+    assert np.all(power >= 0)
+    # 양자화 간격 안의 풍속은 같은 캐시 값을 공유
+    assert power[0] == power[1] == power[2]
+    assert len(model._cache) == 3
+
+    model.calculate_power(wind_speeds, 1.225)
+    assert len(model._cache) == 3
+
+def test_calculate_power_non_finite(model):
+    """결측(비유한) 풍속/밀도 처리 테스트"""
+    with np.errstate(all="raise"):
+        power = model.calculate_power(np.array([np.nan, 10.0, np.inf]),
+                                      np.array([1.225, 1.225, 1.225]))
+    assert np.isnan(power[0]) and np.isnan(power[2])
+    assert power[1] > 0
+    assert len(model._cache) == 1
+
+    assert np.isnan(model.calculate_power(10.0, np.nan)).all()
+    assert len(model._cache) == 1
+
+def test_ground_calculator_rejected():
+    """지상형 계산기 입력 시 오류 테스트"""
+    with pytest.raises(ValueError):
+        PumpingCycleModel(PowerCalculator(system_type="ground"))
@@ -0,0 +1,95 @@
+import tracemalloc
+
+import pytest
+import numpy as np
+from utils.memory import MemoryBudget, MemoryBudgetExceeded, MemoryProfiler, current_rss
+
+MIB = 2**20
+
+def test_stage_peak_and_retained():
+    """단계별 최대/잔류 할당량 테스트"""
+    profiler = MemoryProfiler()
+    with profiler.stage("allocate") as record:
+        temporary = np.ones(4 * MIB // 8)
+        kept = np.ones(MIB // 8)
+        del temporary
+
+    assert record["stage"] == "allocate"
+    assert record["peak_bytes"] >= 5 * MIB
+    assert MIB <= record["retained_bytes"] < 2 * MIB
+    assert not tracemalloc.is_tracing()  # 프로파일러가 시작한 추적은 종료
+    del kept
+
+def test_nested_stages():
+    """중첩 단계의 최대값 전파 테스트"""
+    profiler = MemoryProfiler()
+    with profiler.stage("outer") as outer:
+        with profiler.stage("inner") as inner:
+            np.ones(2 * MIB // 8)
+        np.ones(MIB // 8)
+
+    assert inner["stage"] == "outer/inner"
+    assert outer["peak_bytes"] >= inner["peak_bytes"] >= 2 * MIB
+    assert [r["stage"] for r in profiler.records] == ["outer/inner", "outer"]
+
+def test_budget_raise():
+    """예산 초과 시 예외 테스트"""
+    profiler = MemoryProfiler(budget=MemoryBudget(peak_bytes=MIB))
+    with pytest.raises(MemoryBudgetExceeded) as excinfo:
+        profiler.call("model", np.ones, 2 * MIB // 8)
+    assert excinfo.value.stage == "model"
+    assert excinfo.value.limit == "peak_bytes"
+
+    # 예산 안에서는 정상 실행
+    assert profiler.call("small", np.ones, 10).shape == (10,)
+
+def test_budget_chunking():
+    """예산 초과 시 분할 계산 전환 테스트"""
+    def model(wind_speed, air_density):
+        # 입력 크기에 비례하는 임시 배열을 만드는 모델
+        return 0.5 * air_density * wind_speed**3
+
+    n = MIB // 8
+    wind_speed = np.linspace(0, 20, n)
+    air_density = np.full(n, 1.225)
+
+    profiler = MemoryProfiler(budget=MemoryBudget(peak_bytes=2 * MIB, on_exceed="chunk"))
+    power = profiler.map_chunked("power", model, wind_speed, air_density)
+
+    assert np.allclose(power, model(wind_speed, air_density))
+    # 전체 크기 실행 없이 처음부터 분할 계산
+    stages = [r["stage"] for r in profiler.records]
+    assert "power" not in stages
+    assert stages[0] == "power[chunked]/0:1024"
+    assert stages[-1] == "power[chunked]"
+    chunks = [r for r in profiler.records if r["stage"].startswith("power[chunked]/")]
+    assert len(chunks) > 2
+    assert all(r["peak_bytes"] <= 2 * MIB for r in profiler.records)
+    assert all(r["exceeded"] is None for r in profiler.records)
+
+    # 명시한 분할 크기는 그대로 사용
+    profiler = MemoryProfiler()
+    power = profiler.map_chunked("power", model, wind_speed, air_density, chunk_size=n // 4)
+    assert np.allclose(power, model(wind_speed, air_density))
+    assert len(profiler.records) == 5
+
+def test_disabled_profiler():
+    """비활성 프로파일러 테스트"""
+    profiler = MemoryProfiler(enabled=False)
+    with profiler.stage("noop") as record:
+        pass
+    assert record is None
+    assert profiler.map_chunked("f", np.negative, np.arange(3)).tolist() == [0, -1, -2]
+    assert profiler.records == []
+
+def test_current_rss():
+    """RSS 측정 테스트"""
+    rss = current_rss()
+    assert rss is None or rss > 0
+
+def test_format_report():
+    """보고서 형식 테스트"""
+    profiler = MemoryProfiler()
+    with profiler.stage("allocate"):
+        np.ones(1000)
+    assert "allocate" in profiler.format_report()
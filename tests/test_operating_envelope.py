@@ -0,0 +1,92 @@
+import pytest
+import numpy as np
+from models.operating_envelope import OperatingEnvelope
+from models.power_calc import PowerCalculator
+from models.specs import PowerSpec
+
+def _reference_mask(envelope, wind_speeds, time_step=1.0, initially_stopped=False):
+    """샘플별 상태 기계로 계산한 기준 운전 가능 여부"""
+    delay = max(int(np.ceil(envelope.restart_delay / time_step - 1e-9)), 1)
+    stopped = initially_stopped
+    calm_run = 0
+    mask = []
+    for v in wind_speeds:
+        calm_run = calm_run + 1 if v < envelope.restart_speed else 0
+        if v > envelope.cut_out_speed:
+            stopped = True
+        elif stopped and calm_run >= delay:
+            stopped = False
+        mask.append(not stopped)
+    return np.array(mask)
+
+def test_cut_in_and_rated_clipping():
+    """컷인과 정격 출력 제한 테스트"""
+    envelope = OperatingEnvelope(rated_power=100, cut_in_speed=3.0, cut_out_speed=20)
+    wind_speeds = np.array([2.0, 5.0, 10.0, 15.0])
+    power = np.array([10.0, 50.0, 150.0, 400.0])
+
+    result = envelope.apply(wind_speeds, power)
+    assert np.allclose(result, [0.0, 50.0, 100.0, 100.0])
+
+def test_cut_out_hysteresis():
+    """컷아웃 히스테리시스 테스트: 재기동 풍속 미만으로 내려가야 재기동"""
+    envelope = OperatingEnvelope(cut_out_speed=25, restart_speed=20)
+    wind_speeds = np.array([15, 26, 24, 22, 21, 19, 22, 26, 18])
+    mask = envelope.operating_mask(wind_speeds)
+    assert mask.tolist() == [True, False, False, False, False, True, True, False, True]
+
+def test_restart_delay():
+    """재기동 지연 테스트"""
+    envelope = OperatingEnvelope(cut_out_speed=25, restart_speed=20, restart_delay=3)
+    wind_speeds = np.array([26, 10, 10, 21, 10, 10, 10, 10])
+    mask = envelope.operating_mask(wind_speeds, time_step=1.0)
+    # 3분 연속 재기동 풍속 미만이 된 시점(인덱스 6)부터 운전
+    assert mask.tolist() == [False, False, False, False, False, False, True, True]
+
+    # 시간 간격이 2분이면 2 샘플 만에 재기동, 재기동 후에는 컷아웃 전까지 계속 운전
+    mask = envelope.operating_mask(wind_speeds, time_step=2.0)
+    assert mask.tolist() == [False, False, True, True, True, True, True, True]
+
+def test_matches_state_machine():
+    """벡터화 결과가 샘플별 상태 기계와 같은지 테스트"""
+    rng = np.random.default_rng(1)
+    wind_speeds = 18 + 6 * np.sin(np.arange(5000) / 40) + rng.normal(0, 2, 5000)
+    for delay in (0, 1, 5, 12.5):
+        for initially_stopped in (False, True):
+            envelope = OperatingEnvelope(cut_in_speed=3, cut_out_speed=25, restart_delay=delay)
+            mask = envelope.operating_mask(wind_speeds, 1.0, initially_stopped)
+            expected = _reference_mask(envelope, wind_speeds, 1.0, initially_stopped)
+            assert np.array_equal(mask, expected)
+
+def test_validation():
+    """설정 검증 테스트"""
+    with pytest.raises(ValueError):
+        OperatingEnvelope(cut_in_speed=25, cut_out_speed=3)
+    with pytest.raises(ValueError):
+        OperatingEnvelope(cut_out_speed=20, restart_speed=22)
+    with pytest.raises(ValueError):
+        OperatingEnvelope(cut_out_speed=20, restart_delay=-1)
+    # 상태 전이는 시간 축 하나를 따라 계산되므로 다차원 풍속은 거부
+    with pytest.raises(ValueError):
+        OperatingEnvelope(cut_out_speed=20).operating_mask(np.full((4, 3), 10.0))
+
+def test_power_calculator_envelope():
+    """PowerCalculator 운전 범위 적용 테스트"""
+    spec = PowerSpec(system_type="ground", area=6361.7, rated_power=2000,
+                     cut_in_speed=3.5, cut_out_speed=25)
+    calculator = PowerCalculator(area=6361.7, system_type="ground",
+                                 envelope=OperatingEnvelope.from_spec(spec))
+    wind_speeds = np.array([2.0, 5.0, 10.0, 20.0, 30.0, 10.0])
+    power = calculator.calculate_actual_power(wind_speeds, 1.225)
+    unbounded = calculator.calculate_power(wind_speeds, 1.225)
+
+    assert power[0] == 0
+    assert np.isclose(power[1], unbounded[1])
+    assert power[3] == 2000
+    assert power[4] == 0
+    # 재기동 지연이 없으면 재기동 풍속(22.5 m/s) 미만이 되는 즉시 재기동
+    assert np.isclose(power[5], unbounded[5])
+    assert np.all(power <= 2000)
+
+    without_envelope = PowerCalculator(area=6361.7, system_type="ground")
+    assert np.allclose(without_envelope.calculate_actual_power(wind_speeds), unbounded)
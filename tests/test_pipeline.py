@@ -0,0 +1,125 @@
+import pytest
+import numpy as np
+from models.operating_envelope import OperatingEnvelope
+from models.specs import load_specs
+from simulators.pipeline import Pipeline, build_simulation_pipeline, fingerprint
+from simulators.simulation_result import SimulationResult
+
+def test_change_recomputes_only_downstream():
+    """파라미터 변경 시 하위 단계만 다시 계산하는지 테스트"""
+    pipeline = build_simulation_pipeline(duration=60)
+    result = pipeline.get("energy")
+    assert isinstance(result, SimulationResult)
+    assert len(result) == 60
+    assert set(pipeline.recomputed) == {"time", "ground_wind_field", "ground_density",
+                                        "ground_power", "awe_wind_field", "awe_density",
+                                        "awe_power", "energy"}
+
+    pipeline.set_params(awe_calculator={"cycle_efficiency": 0.8})
+    updated = pipeline.get("energy")
+    assert pipeline.recomputed == ["awe_power", "energy"]
+
+    # 상위 단계 출력은 그대로 재사용
+    assert np.shares_memory(updated["ground_power"], result["ground_power"])
+    assert np.allclose(updated["awe_power"], result["awe_power"] * 0.8 / 0.85)
+
+def test_cached_outputs_reused():
+    """같은 파라미터로 다시 조회 시 재계산하지 않는지 테스트"""
+    pipeline = build_simulation_pipeline()
+    first = pipeline.get("energy")
+    assert pipeline.get("energy") is first
+    assert pipeline.recomputed == []
+
+    # 이전 값으로 되돌리면 캐시된 출력 사용
+    pipeline.set_params(seed=1)
+    pipeline.get("energy")
+    pipeline.set_params(seed=0)
+    assert pipeline.get("energy") is first
+    assert pipeline.recomputed == []
+
+def test_wind_change_recomputes_power_not_density():
+    """풍속 파라미터 변경 시 밀도 단계는 재사용하는지 테스트"""
+    pipeline = build_simulation_pipeline()
+    pipeline.get("energy")
+    pipeline.set_params(wind_profile={"power_law_exponent": 0.14})
+    pipeline.get("energy")
+    assert pipeline.recomputed == ["ground_wind_field", "ground_power",
+                                   "awe_wind_field", "awe_power", "energy"]
+
+def test_height_change_recomputes_one_system():
+    """한 시스템의 고도 변경 시 다른 시스템은 재사용하는지 테스트"""
+    pipeline = build_simulation_pipeline(duration=60)
+    result = pipeline.get("energy")
+    pipeline.set_params(awe_height=250.0)
+    updated = pipeline.get("energy")
+    assert pipeline.recomputed == ["awe_wind_field", "awe_density", "awe_power", "energy"]
+    assert np.shares_memory(updated["ground_wind_speed"], result["ground_wind_speed"])
+    assert np.shares_memory(updated["ground_power"], result["ground_power"])
+
+    # 시스템별 난수 스트림은 서로 독립이며 seed로 재현 가능
+    again = build_simulation_pipeline(duration=60, awe_height=250.0).get("energy")
+    assert np.array_equal(again["awe_wind_speed"], updated["awe_wind_speed"])
+    assert np.array_equal(again["ground_wind_speed"], result["ground_wind_speed"])
+
+def test_envelopes_from_config():
+    """기본 운전 범위가 config.yaml에서 오는지 테스트"""
+    specs = load_specs()
+    pipeline = build_simulation_pipeline(awe_envelope={"rated_power": 50})
+    assert pipeline.params["ground_envelope"] == {"rated_power": 2000, "cut_in_speed": 3.5,
+                                                  "cut_out_speed": 25}
+    expected = dict(OperatingEnvelope.spec_arguments(specs["awe_system"]), rated_power=50)
+    assert pipeline.params["awe_envelope"] == expected
+    assert pipeline.get("awe_power").max() <= 50
+
+def test_custom_pipeline():
+    """사용자 정의 파이프라인 테스트"""
+    pipeline = Pipeline({"a": 2, "b": np.arange(3)})
+    pipeline.add_stage("double", lambda a: a * 2, params=("a",))
+    pipeline.add_stage("total", lambda b, double: b.sum() + double, inputs=("double",), params=("b",))
+    assert pipeline.get("total") == 7
+
+    assert pipeline.recomputed == ["double", "total"]
+
+    # recomputed는 마지막 조회의 재계산 단계만 보관
+    pipeline.set_params(b=np.arange(4))
+    assert pipeline.get("total") == 10
+    assert pipeline.recomputed == ["total"]
+
+    with pytest.raises(ValueError):
+        pipeline.add_stage("broken", lambda: None, inputs=("missing",))
+    with pytest.raises(KeyError):
+        pipeline.get("missing")
+
+def test_fingerprint():
+    """캐시 키 생성 테스트"""
+    assert fingerprint(np.arange(3)) == fingerprint(np.arange(3))
+    assert fingerprint(np.arange(3)) != fingerprint(np.arange(3.0))
+    assert fingerprint({"x": 1, "y": [1, 2]}) == fingerprint({"y": [1, 2], "x": 1})
+    hash(fingerprint({"x": np.ones(2)}))
+
+def test_run_simulation_uses_pipeline(capsys):
+    """main.run_simulation이 같은 파이프라인 결과를 반환하는지 테스트"""
+    from main import run_simulation
+
+    result = run_simulation(plot=False)
+    expected = build_simulation_pipeline().get("energy")
+    assert set(result.names) == set(expected.names)
+    for name in expected.names:
+        assert np.array_equal(result[name], expected[name])
+    assert "AWE 시스템" in capsys.readouterr().out
+
+def test_calendar_resampling_of_run_output(capsys):
+    """실제 실행 결과의 달력 단위 리샘플링 테스트 (config.yaml의 start_date)"""
+    from main import run_simulation
+
+    result = run_simulation(plot=False)
+    assert result.start_time == np.datetime64("2024-01-01T00:00")
+    starts, energy = result.resample("awe_power", "day", how="energy")
+    assert len(starts) == 1
+    assert np.isclose(energy[0], result.total_energy("awe_power"))
+
+    # 이틀에 걸친 파이프라인 결과는 일별 구간 2개
+    two_days = build_simulation_pipeline(duration=2 * 24 * 60, time_step=10).get("energy")
+    starts, energy = two_days.resample("ground_power", "day", how="energy")
+    assert np.array_equal(starts, [0.0, 24 * 60.0])
+    assert np.isclose(energy.sum(), two_days.total_energy("ground_power"))
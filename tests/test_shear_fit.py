@@ -0,0 +1,86 @@
+import pytest
+import numpy as np
+from models.shear_fit import VON_KARMAN, fit_log_law, fit_power_law
+from models.wind_profile import WindProfile
+
+HEIGHTS = np.array([10.0, 40.0, 80.0, 120.0])
+
+def test_fit_power_law_exact():
+    """정확한 지수 법칙 데이터에 대한 적합 테스트"""
+    alpha = np.array([0.1, 0.14, 0.3])
+    reference_speed = np.array([4.0, 5.0, 6.0])
+    speeds = reference_speed[:, None] * (HEIGHTS / 10.0) ** alpha[:, None]
+
+    fitted_alpha, fitted_speed = fit_power_law(HEIGHTS, speeds)
+    assert np.allclose(fitted_alpha, alpha)
+    assert np.allclose(fitted_speed, reference_speed)
+
+def test_fit_power_law_chunked_matches_full():
+    """분할 처리 결과가 전체 처리 결과와 같은지 테스트"""
+    rng = np.random.default_rng(0)
+    alpha = rng.uniform(0.05, 0.4, 10_000)
+    speeds = 5.0 * (HEIGHTS / 10.0) ** alpha[:, None] * rng.uniform(0.97, 1.03, (10_000, 4))
+
+    full = fit_power_law(HEIGHTS, speeds, chunk_size=None)
+    chunked = fit_power_law(HEIGHTS, speeds, chunk_size=333)
+    assert np.allclose(full[0], chunked[0])
+    assert np.allclose(full[1], chunked[1])
+    assert np.abs(full[0] - alpha).mean() < 0.02
+
+def test_fit_power_law_missing_values():
+    """결측/저풍속 값 제외 테스트"""
+    speeds = 5.0 * (HEIGHTS / 10.0) ** 0.2 * np.ones((3, 4))
+    speeds[0, 1] = np.nan          # 결측 하나: 나머지 3개로 적합
+    speeds[1, :3] = 0.0            # 유효 점 1개: 적합 불가
+    speeds[2, 3] = 100.0           # 이상값 포함: 적합은 되지만 지수가 달라짐
+
+    alpha, _ = fit_power_law(HEIGHTS, speeds)
+    assert np.isclose(alpha[0], 0.2)
+    assert np.isnan(alpha[1])
+    assert alpha[2] > 0.2
+
+def test_fit_log_law():
+    """로그 법칙 적합 테스트"""
+    friction_velocity = np.array([0.3, 0.5])
+    roughness_length = np.array([0.03, 0.5])
+    speeds = (friction_velocity[:, None] / VON_KARMAN) * np.log(HEIGHTS / roughness_length[:, None])
+
+    fitted_u, fitted_z0 = fit_log_law(HEIGHTS, speeds)
+    assert np.allclose(fitted_u, friction_velocity)
+    assert np.allclose(fitted_z0, roughness_length)
+
+def test_invalid_shapes():
+    """입력 형태 검증 테스트"""
+    with pytest.raises(ValueError):
+        fit_power_law(HEIGHTS, np.ones((5, 3)))
+    with pytest.raises(ValueError):
+        fit_power_law(np.array([0.0, 10.0]), np.ones((5, 2)))
+
+def test_time_varying_exponent_in_wind_profile():
+    """시간 변화 지수를 풍속 시계열 계산에 반영하는 테스트"""
+    wp = WindProfile(reference_height=10, reference_speed=5.0)
+    times = np.arange(0, 120, 1.0)
+    alpha = np.linspace(0.1, 0.3, times.shape[0])
+
+    series = wp.calculate_wind_speed_series(300, times, power_law_exponent=alpha, turbulence=False)
+    expected = 5.0 * 30 ** alpha + 0.2 * 5.0 * np.sin(2 * np.pi * times / 60)
+    assert np.allclose(series, expected)
+
+    fixed = wp.calculate_wind_speed_series(300, times, turbulence=False)
+    assert np.allclose(fixed, 5.0 * 30 ** 0.14 + 0.2 * 5.0 * np.sin(2 * np.pi * times / 60))
+
+    # 관측 마스트 적합 결과: 합성 변동 없이 적합된 프로파일만 외삽
+    mast_speeds = 12.0 * (HEIGHTS / 10.0) ** 0.2
+    fitted_alpha, fitted_speed = fit_power_law(HEIGHTS, np.tile(mast_speeds, (4, 1)))
+    mast = wp.calculate_wind_speed_series(10, times[:4], power_law_exponent=fitted_alpha,
+                                          reference_speed=fitted_speed,
+                                          turbulence=False, time_variation=False)
+    assert np.allclose(mast, 12.0)
+    assert np.allclose(wp.calculate_wind_speed_series(120, times[:4], fitted_alpha, fitted_speed,
+                                                      turbulence=False, time_variation=False),
+                       mast_speeds[-1])
+
+    # 합성 변동은 시간 스텝별 기준 풍속에 비례
+    varied = wp.calculate_wind_speed_series(10, times[:16], reference_speed=np.full(16, 12.0),
+                                            turbulence=False)
+    assert np.allclose(varied, 12.0 + 0.2 * 12.0 * np.sin(2 * np.pi * times[:16] / 60))
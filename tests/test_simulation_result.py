@@ -0,0 +1,96 @@
+import pytest
+import numpy as np
+from simulators.simulation_result import SimulationResult
+
+@pytest.fixture
+def result():
+    """테스트용 2일치 1분 간격 결과"""
+    time = np.arange(0, 2 * 24 * 60, 1.0)
+    power = np.arange(time.shape[0], dtype=float)
+    wind = 5.0 + np.sin(2 * np.pi * time / 60)
+    return SimulationResult(time, 1.0, {"power": power, "wind_speed": wind},
+                            start_time="2024-01-31")
+
+def test_base_arrays_not_copied():
+    """기본 배열이 복사되지 않고 읽기 전용으로 보관되는지 테스트"""
+    time = np.arange(10.0)
+    power = np.ones(10)
+    res = SimulationResult(time, 1.0, {"power": power})
+
+    assert np.shares_memory(res["power"], power)
+    assert not res["power"].flags.writeable
+    assert power.flags.writeable  # 원본 배열은 그대로 쓰기 가능
+
+def test_length_mismatch():
+    """시계열 길이 불일치 테스트"""
+    with pytest.raises(ValueError):
+        SimulationResult(np.arange(10.0), 1.0, {"power": np.ones(5)})
+
+def test_resample_hourly(result):
+    """시간 단위 리샘플링 테스트"""
+    starts, means = result.resample("power", 60, how="mean")
+    assert len(starts) == 48
+    assert np.allclose(means, result["power"].reshape(48, 60).mean(axis=1))
+
+    _, maxima = result.resample("power", 60, how="max")
+    assert np.allclose(maxima, result["power"].reshape(48, 60).max(axis=1))
+
+    _, energy = result.resample("power", 60, how="energy")
+    assert np.allclose(energy, result["power"].reshape(48, 60).sum(axis=1) / 60)
+    assert np.isclose(energy.sum(), result.total_energy("power"))
+
+def test_resample_calendar(result):
+    """달력 단위 리샘플링 테스트"""
+    starts, sums = result.resample("power", "month", how="sum")
+    # 1월 31일과 2월 1일 두 구간
+    assert len(starts) == 2
+    assert np.isclose(sums.sum(), result["power"].sum())
+
+    starts, _ = result.resample("power", "day")
+    assert np.array_equal(starts, [0, 1440])
+
+    no_start = SimulationResult(np.arange(10.0), 1.0, {"power": np.ones(10)})
+    with pytest.raises(ValueError):
+        no_start.resample("power", "day")
+
+def test_aggregates_cached(result):
+    """집계 결과 캐시 테스트"""
+    first = result.resample("wind_speed", 60)
+    second = result.resample("wind_speed", 60)
+    assert first[1] is second[1]
+    assert not first[1].flags.writeable
+
+    result.clear_cache()
+    assert result.resample("wind_speed", 60)[1] is not first[1]
+
+def test_rolling(result):
+    """이동 통계 테스트"""
+    values = result["wind_speed"]
+    window = 30
+    windows = np.lib.stride_tricks.sliding_window_view(values, window)
+
+    assert np.allclose(result.rolling("wind_speed", window), windows.mean(axis=1))
+    assert np.allclose(result.rolling("wind_speed", window, "std"), windows.std(axis=1))
+    assert np.allclose(result.rolling("wind_speed", window, "max"), windows.max(axis=1))
+
+    with pytest.raises(ValueError):
+        result.rolling("wind_speed", 0)
+
+def test_duration_curve(result):
+    """지속 곡선 테스트"""
+    exceedance, ordered = result.duration_curve("wind_speed")
+    assert len(ordered) == len(result)
+    assert np.all(np.diff(ordered) <= 0)
+    assert np.isclose(exceedance[-1], 1.0)
+
+def test_empty_result():
+    """빈 시계열 집계 테스트"""
+    empty = SimulationResult(np.zeros(0), 1.0, {"power": np.zeros(0)}, start_time="2024-01-01")
+
+    starts, values = empty.resample("power", 60)
+    assert len(starts) == 0 and len(values) == 0
+    assert len(empty.resample("power", "day", how="energy")[1]) == 0
+    assert empty.total_energy("power") == 0.0
+    assert len(empty.duration_curve("power")[1]) == 0
+    with pytest.raises(ValueError):
+        empty.resample("power", 0)
@@ -0,0 +1,88 @@
+import pickle
+from pathlib import Path
+
+import pytest
+import numpy as np
+from models.air_density import AirDensity
+from models.power_calc import PowerCalculator
+from models.specs import (AirDensitySpec, PowerSpec, WindProfileSpec,
+                          compile_specs, load_specs)
+from models.wind_profile import WindProfile
+
+CONFIG_PATH = Path(__file__).resolve().parent.parent / "config.yaml"
+
+def test_load_specs_from_config():
+    """config.yaml로부터 명세 컴파일 테스트"""
+    pytest.importorskip("yaml")
+    specs = load_specs(CONFIG_PATH)
+
+    assert specs["wind_profile"].power_law_exponent == 0.14
+    assert specs["air_density"].temperature_lapse_rate == 0.0065
+    assert np.isclose(specs["ground_turbine"].area, np.pi * 45 ** 2)
+    assert specs["ground_turbine"].rated_power == 2000
+    assert specs["awe_system"].cut_in_speed == 3.0
+    assert specs["awe_system"].cut_out_speed == 20.0
+
+def test_specs_are_immutable():
+    """명세 불변성 테스트"""
+    spec = WindProfileSpec(reference_height=10, reference_speed=5.0)
+    with pytest.raises(AttributeError):
+        spec.power_law_exponent = 0.2
+    with pytest.raises(AttributeError):
+        spec.new_attribute = 1
+    with pytest.raises(AttributeError):
+        del spec.scale
+    assert not hasattr(spec, "__dict__")
+
+def test_specs_pickle_roundtrip():
+    """명세 피클링 테스트"""
+    spec = PowerSpec(system_type="awe", area=50.0, cycle_efficiency=0.85, rated_power=100)
+    restored = pickle.loads(pickle.dumps(spec))
+    assert restored == spec
+    assert hash(restored) == hash(spec)
+    assert restored.power_factor == spec.power_factor
+
+def test_validation():
+    """설정 검증 테스트"""
+    with pytest.raises(ValueError):
+        WindProfileSpec(reference_height=0, reference_speed=5.0)
+    with pytest.raises(ValueError):
+        PowerSpec(cycle_efficiency=1.5)
+    with pytest.raises(ValueError):
+        PowerSpec(power_coefficient=0.7)
+    with pytest.raises(ValueError):
+        PowerSpec(cut_in_speed=25, cut_out_speed=3)
+    with pytest.raises(ValueError):
+        compile_specs({"ground_turbine": {"rotor_diameter": 90, "unknown_key": 1}})
+
+def test_specs_match_models():
+    """명세 계산 결과가 기존 모델과 같은지 테스트"""
+    heights = np.array([10.0, 80.0, 300.0])
+    wind_speeds = np.array([3.0, 8.0, 12.0])
+
+    wind_spec = WindProfileSpec(reference_height=10, reference_speed=4.0, power_law_exponent=0.2)
+    wind_profile = WindProfile(reference_height=10, reference_speed=4.0, power_law_exponent=0.2)
+    assert np.allclose(wind_spec.mean_wind_speed(heights), wind_profile.calculate_mean_wind_speed(heights))
+
+    density_spec = AirDensitySpec(temperature_lapse_rate=0.04)
+    assert np.allclose(density_spec.density(heights), AirDensity().calculate_density(heights))
+
+    for calculator in (PowerCalculator(area=100.0, system_type="ground"),
+                       PowerCalculator(area=50.0, cycle_efficiency=0.85, system_type="awe")):
+        spec = PowerSpec.from_calculator(calculator)
+        assert np.allclose(spec.power(wind_speeds, 1.2), calculator.calculate_power(wind_speeds, 1.2))
+        densities = [1.2, 1.1, 1.0]  # 리스트 입력도 원소별 계산
+        assert np.allclose(spec.power(wind_speeds, densities),
+                           calculator.calculate_power(wind_speeds, densities))
+
+    theta = 0.3
+    awe = PowerCalculator(area=50.0, system_type="awe")
+    spec = PowerSpec.from_calculator(awe, theta=theta)
+    assert np.allclose(spec.power(wind_speeds), awe.calculate_power(wind_speeds, theta=theta))
+
+def test_wind_profile_max_height():
+    """풍속 프로파일 최대 고도 적용 테스트"""
+    spec = WindProfileSpec(reference_height=10, reference_speed=5.0, max_height=500)
+    assert np.isclose(spec.mean_wind_speed(500), 5.0 * 50 ** 0.14)
+    with pytest.raises(ValueError):
+        spec.mean_wind_speed(np.array([100.0, 600.0]))
@@ -0,0 +1,146 @@
+import os
+import time
+
+import pytest
+import numpy as np
+from models.specs import WindProfileSpec, load_specs
+from simulators import sweep
+from simulators.sweep import (SweepSpec, SweepQueue, evaluate_point, merge_results,
+                              run_sweep, run_worker)
+
+@pytest.fixture
+def spec():
+    """테스트용 스윕 정의 (3 x 4 = 12 조합, 샤드 4개)"""
+    return SweepSpec(
+        grid={
+            "wind_profile.power_law_exponent": [0.1, 0.14, 0.2],
+            "power.area": [25.0, 50.0, 75.0, 100.0],
+        },
+        fixed={"power.system_type": "awe"},
+        height=300.0,
+        shard_size=3,
+    )
+
+def test_spec_enumeration(spec):
+    """격자 열거 및 샤드 분할 테스트"""
+    assert spec.n_points == 12
+    assert spec.n_shards == 4
+    assert spec.point(0)["wind_profile.power_law_exponent"] == 0.1
+    assert spec.point(5) == {"power.system_type": "awe",
+                             "wind_profile.power_law_exponent": 0.14,
+                             "power.area": 50.0}
+    covered = [i for shard in range(spec.n_shards) for i in spec.shard_range(shard)]
+    assert covered == list(range(spec.n_points))
+
+    with pytest.raises(ValueError):
+        SweepSpec(grid={"area": [1.0]})
+
+def test_run_sweep_matches_direct_evaluation(spec, tmp_path):
+    """스윕 결과가 직접 평가 결과와 같은지 테스트"""
+    merged = run_sweep(spec, tmp_path / "queue")
+
+    assert np.array_equal(merged["index"], np.arange(spec.n_points))
+    for i in range(spec.n_points):
+        expected = evaluate_point(spec.point(i), spec.height)
+        assert np.isclose(merged["power"][i], expected["power"])
+    assert np.allclose(merged["power.area"], np.tile([25.0, 50.0, 75.0, 100.0], 3))
+
+def test_parallel_workers_merge_deterministically(spec, tmp_path):
+    """여러 작업자 프로세스 결과 병합의 결정성 테스트"""
+    serial = run_sweep(spec, tmp_path / "serial")
+    parallel = run_sweep(spec, tmp_path / "parallel", n_workers=3)
+    for key in serial:
+        assert np.array_equal(serial[key], parallel[key])
+
+def test_crashed_worker_recovery(spec, tmp_path):
+    """중단된 작업자의 샤드를 다른 작업자가 회수하는지 테스트"""
+    root = tmp_path / "queue"
+    queue = SweepQueue(root)
+    queue.submit(spec)
+
+    # 작업자가 샤드를 획득한 뒤 결과를 쓰지 못하고 중단됨
+    crashed = queue.claim("crashed")
+    assert crashed is not None
+    old = time.time() - 3600
+    for path in queue.claimed_dir.iterdir():
+        os.utime(path, (old, old))
+
+    # 하트비트가 살아 있는 샤드는 회수하지 않음
+    assert run_worker(root, worker_id="survivor", stale_after=None) == spec.n_shards - 1
+    with pytest.raises(RuntimeError):
+        merge_results(root)
+
+    # 새로 참여한 작업자가 끊긴 샤드를 회수
+    assert run_worker(root, worker_id="late", stale_after=60) == 1
+    assert queue.is_done()
+    assert len(merge_results(root)["index"]) == spec.n_points
+
+def test_claim_of_old_submission_not_requeued(spec, tmp_path, monkeypatch):
+    """제출된 지 오래된 샤드를 획득한 직후 회수되지 않는지 테스트"""
+    root = tmp_path / "queue"
+    queue = SweepQueue(root)
+    queue.submit(spec)
+    old = time.time() - 3600
+    for path in queue.pending_dir.iterdir():
+        os.utime(path, (old, old))
+
+    # 획득(rename) 직후 유휴 작업자가 끊긴 샤드를 회수하려고 시도
+    rename = os.rename
+    requeued = []
+
+    def rename_then_requeue(source, destination):
+        rename(source, destination)
+        requeued.append(queue.requeue_stale(60))
+
+    monkeypatch.setattr(sweep.os, "rename", rename_then_requeue)
+    shard_id = queue.claim("worker", stale_after=60)
+    monkeypatch.undo()
+
+    assert shard_id is not None
+    assert requeued == [0]
+    assert len(list(queue.claimed_dir.iterdir())) == 1
+
+def test_slow_shard_not_requeued(spec, tmp_path, monkeypatch):
+    """처리 시간이 stale_after보다 긴 샤드가 회수되지 않는지 테스트"""
+    root = tmp_path / "queue"
+    queue = SweepQueue(root)
+    queue.submit(spec)
+    stale_after = 0.25
+    requeued = []
+
+    def slow_evaluate_point(params, height):
+        time.sleep(0.15)
+        # 다른 작업자가 처리 도중에 끊긴 샤드를 회수하려고 시도
+        requeued.append(queue.requeue_stale(stale_after))
+        return evaluate_point(params, height)
+
+    monkeypatch.setattr(sweep, "evaluate_point", slow_evaluate_point)
+    assert run_worker(root, worker_id="slow", stale_after=stale_after, max_shards=1) == 1
+
+    # 샤드 하나(조합 3개)에 0.45초 이상 걸렸지만 회수되지 않음
+    assert requeued == [0] * spec.shard_size
+    assert len(queue.completed_shards()) == 1
+    assert len(list(queue.pending_dir.iterdir())) == spec.n_shards - 1
+
+def test_resubmit_skips_completed(spec, tmp_path):
+    """재등록 시 완료된 샤드를 건너뛰는지 테스트"""
+    root = tmp_path / "queue"
+    queue = SweepQueue(root)
+    assert queue.submit(spec) == spec.n_shards
+    run_worker(root, max_shards=2)
+    assert queue.submit(spec) == 0
+
+    other = SweepSpec(grid={"power.area": [1.0]})
+    with pytest.raises(ValueError):
+        queue.submit(other)
+
+def test_evaluate_point_uses_config_defaults():
+    """스윕 평가가 config.yaml의 풍속/밀도 명세를 기본값으로 쓰는지 테스트"""
+    specs = load_specs()
+    result = evaluate_point({"power.system_type": "awe",
+                             "wind_profile.power_law_exponent": 0.2}, height=300.0)
+    wind_kwargs = specs["wind_profile"].to_dict()
+    wind_kwargs["power_law_exponent"] = 0.2
+    assert np.isclose(result["wind_speed"],
+                      WindProfileSpec(**wind_kwargs).mean_wind_speed(300.0))
+    assert np.isclose(result["air_density"], specs["air_density"].density(300.0))
@@ -0,0 +1,139 @@
+import pytest
+import numpy as np
+from utils import wind_archive
+from models.power_calc import PowerCalculator
+from utils.wind_archive import WindArchive
+
+@pytest.fixture
+def archive(tmp_path):
+    """테스트용 2년치 10분 간격 아카이브"""
+    times = np.arange(np.datetime64("2023-01-01T00:00"), np.datetime64("2025-01-01T00:00"),
+                      np.timedelta64(10, "m"))
+    rng = np.random.default_rng(0)
+    wind_speed = rng.uniform(0, 20, times.shape[0])
+    air_density = np.full(times.shape[0], 1.2)
+    return WindArchive.create(tmp_path / "wind", times,
+                              {"wind_speed": wind_speed, "air_density": air_density})
+
+def test_open_is_memory_mapped(archive):
+    """메모리 맵 열기 테스트"""
+    reopened = WindArchive(archive.path)
+    assert isinstance(reopened.columns["wind_speed"], np.memmap)
+    assert len(reopened) == len(archive)
+    assert reopened.column_names == ["wind_speed", "air_density"]
+
+def test_range_query_zero_copy(archive):
+    """기간 조회가 복사 없는 슬라이스를 반환하는지 테스트"""
+    window = archive.range("2024-02-01", "2024-03-01")
+    assert len(window) == 29 * 24 * 6  # 2024년 2월은 29일
+    assert window.time[0] == np.datetime64("2024-02-01T00:00")
+    assert window.time[-1] == np.datetime64("2024-02-29T23:50")
+    assert np.shares_memory(window["wind_speed"], archive.columns["wind_speed"])
+
+    # WindProfile / PowerCalculator 계산에 그대로 사용
+    calculator = PowerCalculator(area=100.0, system_type="ground")
+    power = calculator.calculate_power(window["wind_speed"], window["air_density"])
+    assert power.shape == (len(window),)
+
+    assert len(archive.range("2030-01-01", "2031-01-01")) == 0
+    assert len(archive.range()) == len(archive)
+
+def test_seasonal_months(archive):
+    """월 단위 계절 조회 테스트"""
+    winter = archive.seasonal(months=(12, 1, 2))
+    months = np.concatenate([w.time.astype("datetime64[M]").astype(int) % 12 + 1 for w in winter])
+    assert set(months) == {12, 1, 2}
+
+    expected = np.isin(archive.time.astype("datetime64[M]").astype(int) % 12 + 1, [12, 1, 2]).sum()
+    assert sum(len(w) for w in winter) == expected
+    # 2023년 1-2월, 2023년 12월-2024년 2월, 2024년 12월 -> 월별 구간 6개
+    assert len(winter) == 6
+
+def test_seasonal_night_hours(archive):
+    """자정을 넘는 시간대 조회 테스트"""
+    nights = archive.seasonal(months=(1,), hours=(22, 6), start="2024-01-01", end="2024-02-01")
+    hours = np.concatenate([w.time.astype("datetime64[h]").astype(int) % 24 for w in nights])
+    assert np.all((hours >= 22) | (hours < 6))
+    # 월 조건은 구간 시작일 기준: 1월 1-31일 밤 구간 (12월 31일 밤은 제외)
+    assert len(nights) == 31
+    assert nights[0].time[0] == np.datetime64("2024-01-01T22:00")
+    assert all(np.shares_memory(w["wind_speed"], archive.columns["wind_speed"]) for w in nights)
+
+def test_append(archive):
+    """데이터 추가 테스트"""
+    n_rows = len(archive)
+    times = np.arange(np.datetime64("2025-01-01T00:00"), np.datetime64("2025-01-02T00:00"),
+                      np.timedelta64(10, "m"))
+    archive.append(times, {"wind_speed": np.ones(times.shape[0]),
+                           "air_density": np.full(times.shape[0], 1.2)})
+    assert len(archive) == n_rows + 144
+    assert len(WindArchive(archive.path).range("2025-01-01")) == 144
+
+    with pytest.raises(ValueError):
+        archive.append(times, {"wind_speed": np.ones(144), "air_density": np.ones(144)})
+
+    # 기존 열과 dtype이 다른 데이터는 변환하지 않고 거부
+    later = times + np.timedelta64(1, "D")
+    with pytest.raises(ValueError):
+        archive.append(later, {"wind_speed": np.ones(144, dtype=np.float32),
+                               "air_density": np.full(144, 1.2)})
+    with pytest.raises(ValueError):
+        archive.append(later, {"wind_speed": np.arange(144),
+                               "air_density": np.full(144, 1.2)})
+    assert len(archive) == n_rows + 144
+
+    # 새 세대로 전환되고 이전 세대는 삭제됨
+    assert archive.generation == "gen-000001"
+    assert sorted(p.name for p in archive.path.glob("gen-*")) == ["gen-000001"]
+
+def test_interrupted_append_keeps_archive(archive, monkeypatch):
+    """세대 전환 전에 중단된 추가가 아카이브를 바꾸지 않는지 테스트"""
+    n_rows = len(archive)
+
+    def crash(path, generation):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(wind_archive.WindArchive, "_switch", staticmethod(crash))
+    times = np.array(["2025-01-01T00:00"], dtype="datetime64[s]")
+    with pytest.raises(KeyboardInterrupt):
+        archive.append(times, {"wind_speed": np.ones(1), "air_density": np.ones(1)})
+    monkeypatch.undo()
+
+    reopened = WindArchive(archive.path)
+    assert len(reopened) == n_rows
+    assert reopened.generation == "gen-000000"
+
+    # 남은 잔여물이 있어도 다시 추가 가능
+    reopened.append(times, {"wind_speed": np.ones(1), "air_density": np.ones(1)})
+    assert len(WindArchive(archive.path)) == n_rows + 1
+
+def test_row_count_mismatch_detected(archive):
+    """열 파일과 meta.json의 행 수 불일치 검출 테스트"""
+    np.save(archive.path / archive.generation / "wind_speed.npy", np.ones(10))
+    with pytest.raises(ValueError):
+        WindArchive(archive.path)
+
+def test_create_validation(tmp_path):
+    """생성 시 입력 검증 테스트"""
+    times = np.array(["2024-01-01T00:10", "2024-01-01T00:00"], dtype="datetime64[m]")
+    with pytest.raises(ValueError):
+        WindArchive.create(tmp_path / "bad", times, {"wind_speed": np.ones(2)})
+    WindArchive.create(tmp_path / "ok", times[::-1], {"wind_speed": np.ones(2)})
+    with pytest.raises(FileExistsError):
+        WindArchive.create(tmp_path / "ok", times[::-1], {"wind_speed": np.ones(2)})
+    WindArchive.create(tmp_path / "ok", times[::-1], {"wind_speed": np.zeros(2)}, overwrite=True)
+    assert np.all(WindArchive(tmp_path / "ok").columns["wind_speed"] == 0)
+
+    # CURRENT 파일이 없는 경로는 overwrite여도 삭제하지 않음
+    unrelated = tmp_path / "unrelated"
+    unrelated.mkdir()
+    (unrelated / "notes.txt").write_text("keep", encoding="utf-8")
+    with pytest.raises(FileExistsError):
+        WindArchive.create(unrelated, times[::-1], {"wind_speed": np.ones(2)}, overwrite=True)
+    assert (unrelated / "notes.txt").read_text(encoding="utf-8") == "keep"
+
+    # 예약된 이름이나 경로 문자가 들어간 열 이름 거부
+    for name in ("time", "meta", "../escape", "a/b", ".hidden", ""):
+        with pytest.raises(ValueError):
+            WindArchive.create(tmp_path / "names", times[::-1], {name: np.ones(2)})
+    assert not (tmp_path / "names").exists()
@@ -0,0 +1,290 @@
+"""
+파이프라인 단계별 메모리 계측 모듈
+
+tracemalloc으로 단계별 최대(peak) 및 잔류(retained) 할당량을 측정하고,
+백그라운드 스레드로 프로세스 RSS를 샘플링합니다.
+예산(MemoryBudget)을 넘으면 실행을 중단하거나, 분할 계산(map_chunked)으로 전환합니다.
+"""
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# map_chunked가 원소당 할당량을 측정할 때 사용하는 앞부분 시험 계산 크기
+_PROBE_ITEMS = 1024
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """메모리 예산 초과 예외"""
+
+    def __init__(self, stage: str, record: Dict[str, Any], limit: str):
+        self.stage = stage
+        self.record = record
+        self.limit = limit
+        super().__init__(f"단계 '{stage}'의 메모리 예산({limit})을 초과했습니다: "
+                         f"peak={record['peak_bytes']} B, retained={record['retained_bytes']} B, "
+                         f"rss_peak={record['rss_peak_bytes']} B")
+
+
+class MemoryBudget:
+    """
+    단계별 메모리 예산 클래스
+
+    on_exceed:
+        "raise": 예산을 넘은 단계에서 MemoryBudgetExceeded를 발생시킵니다.
+        "chunk": 기록만 남기고, map_chunked 호출은 처음부터 분할 계산합니다.
+    """
+
+    def __init__(self, peak_bytes: Optional[int] = None,
+                 retained_bytes: Optional[int] = None,
+                 rss_bytes: Optional[int] = None,
+                 on_exceed: str = "raise"):
+        """
+        초기화 함수
+
+        Args:
+            peak_bytes: 단계별 최대 할당 증가량 한도 (B)
+            retained_bytes: 단계 종료 후 잔류 할당량 한도 (B)
+            rss_bytes: 단계 중 프로세스 RSS 한도 (B)
+            on_exceed: 초과 시 동작 ("raise" 또는 "chunk")
+        """
+        if on_exceed not in ("raise", "chunk"):
+            raise ValueError(f"지원하지 않는 초과 동작입니다: {on_exceed}")
+        self.peak_bytes = peak_bytes
+        self.retained_bytes = retained_bytes
+        self.rss_bytes = rss_bytes
+        self.on_exceed = on_exceed
+
+    def violation(self, record: Dict[str, Any]) -> Optional[str]:
+        """예산을 넘은 항목 이름을 반환합니다 (없으면 None)."""
+        if self.peak_bytes is not None and record["peak_bytes"] > self.peak_bytes:
+            return "peak_bytes"
+        if self.retained_bytes is not None and record["retained_bytes"] > self.retained_bytes:
+            return "retained_bytes"
+        if (self.rss_bytes is not None and record["rss_peak_bytes"] is not None
+                and record["rss_peak_bytes"] > self.rss_bytes):
+            return "rss_bytes"
+        return None
+
+
+def current_rss() -> Optional[int]:
+    """
+    현재 프로세스의 RSS(상주 메모리)를 반환합니다.
+    Linux에서는 /proc/self/statm을, 그 외에는 getrusage의 최대 RSS를 사용합니다.
+
+    Returns:
+        RSS (B), 측정할 수 없으면 None
+    """
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+class MemoryProfiler:
+    """
+    파이프라인 단계/모델 호출별 메모리 계측 클래스
+    단계는 중첩할 수 있으며, 바깥 단계의 최대값에는 안쪽 단계의 최대값이 포함됩니다.
+    """
+
+    def __init__(self, budget: Optional[MemoryBudget] = None,
+                 sample_interval: float = 0.005,
+                 enabled: bool = True):
+        """
+        초기화 함수
+
+        Args:
+            budget: 단계별 메모리 예산
+            sample_interval: RSS 샘플링 간격 (s)
+            enabled: False이면 계측 없이 함수만 실행합니다
+        """
+        self.budget = budget
+        self.sample_interval = float(sample_interval)
+        self.enabled = enabled
+        self.records: List[Dict[str, Any]] = []
+        self._stack: List[Dict[str, Any]] = []
+        self._started_tracing = False
+        self._sampler: Optional[threading.Thread] = None
+        self._sampler_stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def _sample_rss(self) -> None:
+        while not self._sampler_stop.wait(self.sample_interval):
+            rss = current_rss()
+            if rss is None:
+                continue
+            with self._lock:
+                for frame in self._stack:
+                    frame["rss_peak"] = max(frame["rss_peak"], rss)
+
+    def _start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._sampler_stop.clear()
+        self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+        self._sampler.start()
+
+    def _stop(self) -> None:
+        self._sampler_stop.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        단계의 메모리 사용량을 계측하는 컨텍스트 관리자
+
+        Args:
+            name: 단계 이름 (중첩 시 "바깥/안쪽" 형태로 기록)
+
+        Yields:
+            단계 종료 후 채워지는 기록 딕셔너리
+        """
+        if not self.enabled:
+            yield None
+            return
+
+        if not self._stack:
+            self._start()
+        current, peak = tracemalloc.get_traced_memory()
+        rss = current_rss() or 0
+        with self._lock:
+            if self._stack:
+                # 안쪽 단계가 reset_peak을 호출하기 전에 바깥 단계의 최대값을 보존
+                parent = self._stack[-1]
+                parent["peak"] = max(parent["peak"], peak)
+            frame = {"name": "/".join([f["name"] for f in self._stack] + [name]),
+                     "start": current, "peak": current, "rss_start": rss, "rss_peak": rss,
+                     "time": time.perf_counter()}
+            self._stack.append(frame)
+        tracemalloc.reset_peak()
+
+        record: Dict[str, Any] = {}
+        try:
+            yield record
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            rss = current_rss() or 0
+            with self._lock:
+                self._stack.pop()
+                frame["peak"] = max(frame["peak"], peak)
+                frame["rss_peak"] = max(frame["rss_peak"], rss)
+                if self._stack:
+                    parent = self._stack[-1]
+                    parent["peak"] = max(parent["peak"], frame["peak"])
+                    parent["rss_peak"] = max(parent["rss_peak"], frame["rss_peak"])
+            if not self._stack:
+                self._stop()
+
+            record.update({
+                "stage": frame["name"],
+                "peak_bytes": frame["peak"] - frame["start"],
+                "retained_bytes": current - frame["start"],
+                "rss_peak_bytes": frame["rss_peak"] or None,
+                "rss_delta_bytes": frame["rss_peak"] - frame["rss_start"],
+                "seconds": time.perf_counter() - frame["time"],
+                "exceeded": None,
+            })
+            self.records.append(record)
+
+        limit = self.budget.violation(record) if self.budget is not None else None
+        if limit is not None:
+            record["exceeded"] = limit
+            if self.budget.on_exceed == "raise":
+                raise MemoryBudgetExceeded(record["stage"], record, limit)
+
+    def call(self, name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        모델 호출 하나를 계측하여 실행합니다.
+
+        Args:
+            name: 호출 이름
+            func: 호출할 함수
+
+        Returns:
+            함수 반환값
+        """
+        with self.stage(name):
+            return func(*args, **kwargs)
+
+    def map_chunked(self, name: str, func: Callable[..., np.ndarray], *arrays: np.ndarray,
+                    chunk_size: Optional[int] = None) -> np.ndarray:
+        """
+        배열 인자에 대해 원소별 모델 함수를 계측하며 실행합니다.
+        최대 할당 예산의 초과 동작이 "chunk"이면, 앞부분 일부를 먼저 계산해
+        원소당 최대 할당량을 측정하고, 출력 배열을 뺀 남은 예산에 맞는 분할 크기로
+        나머지를 계산합니다. 전체 크기로 한 번 실행한 뒤 다시 계산하지 않습니다.
+
+        Args:
+            name: 호출 이름
+            func: 첫 번째 축을 따라 원소별로 계산되는 함수
+            arrays: 길이가 같은 입력 배열
+            chunk_size: 분할 크기 (None이면 예산에 따라 정하거나 전체를 한 번에 계산)
+
+        Returns:
+            출력 배열 (입력과 같은 길이)
+        """
+        n_items = arrays[0].shape[0]
+        budget = self.budget
+        probing = (chunk_size is None and self.enabled and budget is not None
+                   and budget.on_exceed == "chunk" and budget.peak_bytes is not None
+                   and n_items > _PROBE_ITEMS)
+        if chunk_size is None and not probing:
+            with self.stage(name):
+                return func(*arrays)
+
+        output = None
+        start = 0
+        with self.stage(f"{name}[chunked]"):
+            if probing:
+                with self.stage(f"0:{_PROBE_ITEMS}") as record:
+                    part = func(*(array[:_PROBE_ITEMS] for array in arrays))
+                output = np.empty((n_items,) + part.shape[1:], dtype=part.dtype)
+                output[:_PROBE_ITEMS] = part
+                start = _PROBE_ITEMS
+                del part
+
+                # 원소당 최대 할당량으로 남은 예산에 맞는 분할 크기 추정 (여유 20%)
+                per_item = max(record["peak_bytes"] / _PROBE_ITEMS, 1.0)
+                available = budget.peak_bytes - output.nbytes
+                if available > 0:
+                    chunk_size = max(1, int(0.8 * available / per_item))
+                else:
+                    chunk_size = _PROBE_ITEMS  # 출력만으로 예산 초과, 시험 계산 크기 유지
+
+            for start in range(start, n_items, chunk_size):
+                stop = min(start + chunk_size, n_items)
+                with self.stage(f"{start}:{stop}"):
+                    part = func(*(array[start:stop] for array in arrays))
+                if output is None:
+                    output = np.empty((n_items,) + part.shape[1:], dtype=part.dtype)
+                output[start:stop] = part
+        return output
+
+    def format_report(self) -> str:
+        """단계별 기록을 표 형태 문자열로 반환합니다."""
+        lines = [f"{'단계':<40} {'peak(KiB)':>11} {'retained(KiB)':>14} {'rss_peak(MiB)':>14} {'초과':>6}",
+                 "-" * 89]
+        for record in self.records:
+            rss = record["rss_peak_bytes"]
+            lines.append(f"{record['stage']:<40} {record['peak_bytes'] / 1024:>11.1f} "
+                         f"{record['retained_bytes'] / 1024:>14.1f} "
+                         f"{(rss or 0) / 2**20:>14.1f} {record['exceeded'] or '':>6}")
+        return "\n".join(lines)
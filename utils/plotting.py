@@ -0,0 +1,86 @@
+"""
+시뮬레이션 결과 그래프 모듈
+
+main.run_simulation과 시뮬레이션 파이프라인의 "plots" 단계가 함께 사용합니다.
+"""
+from simulators.simulation_result import SimulationResult
+
+
+def plot_results(result: SimulationResult, duration: float):
+    """
+    시뮬레이션 결과 그래프를 저장하고 표시합니다.
+    matplotlib은 그래프를 그릴 때만 불러옵니다.
+    
+    Args:
+        result: 시뮬레이션 결과
+        duration: 시뮬레이션 기간 (분)
+    """
+    import matplotlib.pyplot as plt
+    
+    time_points = result.time
+    ground_power = result["ground_power"]
+    awe_power = result["awe_power"]
+    ground_cumulative_energy = result.cumulative_energy("ground_power")
+    awe_cumulative_energy = result.cumulative_energy("awe_power")
+    
+    # 분당 전력 생산량 그래프
+    plt.figure(figsize=(12, 6))
+    plt.plot(time_points, ground_power, 'b-', label='Ground Wind Turbine', linewidth=2)
+    plt.plot(time_points, awe_power, 'r-', label='AWE System', linewidth=2)
+    
+    # 그래프 스타일 설정
+    plt.title('Hourly Power Output Comparison', fontsize=14, pad=15)
+    plt.xlabel('Time (minutes)', fontsize=12)
+    plt.ylabel('Power (kW)', fontsize=12)
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.legend(fontsize=10)
+    
+    # y축 범위 설정 (0부터 시작)
+    plt.ylim(bottom=0)
+    
+    # 그래프 여백 조정
+    plt.tight_layout()
+    
+    # 그래프 저장
+    plt.savefig('power_production_comparison.png', dpi=300, bbox_inches='tight')
+    
+    # 누적 에너지 생산량 그래프
+    plt.figure(figsize=(12, 6))
+    plt.plot(time_points, ground_cumulative_energy, 'b-', label='Ground Wind Turbine', linewidth=2)
+    plt.plot(time_points, awe_cumulative_energy, 'r-', label='AWE System', linewidth=2)
+    
+    # 그래프 스타일 설정
+    plt.title('Cumulative Energy Production', fontsize=14, pad=15)
+    plt.xlabel('Time (minutes)', fontsize=12)
+    plt.ylabel('Cumulative Energy (kWh)', fontsize=12)
+    plt.grid(True, linestyle='--', alpha=0.7)
+    plt.legend(fontsize=10)
+    
+    # y축 범위 설정 (0부터 시작)
+    plt.ylim(bottom=0)
+    
+    # 마지막 지점에 실제 값 표시
+    final_ground_energy = ground_cumulative_energy[-1]
+    final_awe_energy = awe_cumulative_energy[-1]
+    
+    # 박스 스타일 설정
+    box_style = dict(boxstyle='round', facecolor='white', alpha=0.8, edgecolor='gray')
+    
+    # 지상형 터빈 값 표시
+    plt.text(duration-0.5, final_ground_energy, 
+             f'Ground: {final_ground_energy:.2f} kWh',
+             bbox=box_style, ha='right', va='bottom')
+    
+    # AWE 시스템 값 표시
+    plt.text(duration-0.5, final_awe_energy,
+             f'AWE: {final_awe_energy:.2f} kWh',
+             bbox=box_style, ha='right', va='top')
+    
+    # 그래프 여백 조정
+    plt.tight_layout()
+    
+    # 그래프 저장
+    plt.savefig('cumulative_energy_comparison.png', dpi=300, bbox_inches='tight')
+    
+    # 모든 그래프 표시
+    plt.show()
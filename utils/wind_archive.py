@@ -0,0 +1,302 @@
+"""
+다년간 풍속 시계열 아카이브 모듈
+
+아카이브는 디렉터리 하나로 구성됩니다.
+    CURRENT             현재 세대 디렉터리 이름
+    gen-<번호>/          세대별 데이터
+        meta.json       열 이름과 dtype, 행 수
+        time.npy        정렬된 시간 인덱스 (datetime64[s])
+        <열 이름>.npy    열별 데이터 (예: wind_speed, air_density)
+
+데이터 추가는 새 세대 디렉터리를 모두 기록한 뒤 CURRENT 파일을 한 번의 rename으로
+교체하므로, 중간에 중단되어도 아카이브는 이전 세대 또는 새 세대 중 하나로 남습니다.
+파일은 메모리 맵으로 열리며, 기간/계절 조회는 시간 인덱스에 대한 이진 탐색으로
+연속 구간을 찾아 복사 없는 슬라이스(WindWindow)를 반환합니다.
+"""
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+TimeLike = Union[str, np.datetime64]
+
+_TIME_DTYPE = "datetime64[s]"
+
+_CURRENT = "CURRENT"
+_GENERATION_FORMAT = "gen-{:06d}"
+
+# 열 이름은 세대 디렉터리 안의 파일 이름으로 쓰이므로 식별자 형식만 허용
+_COLUMN_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_RESERVED_NAMES = ("time", "meta")
+
+
+class WindWindow:
+    """
+    아카이브의 연속 구간 (메모리 맵의 복사 없는 슬라이스)
+    열 배열은 WindProfile / PowerCalculator 계산에 그대로 전달할 수 있습니다.
+    """
+
+    def __init__(self, time: np.ndarray, columns: Dict[str, np.ndarray], start_index: int):
+        """
+        초기화 함수
+
+        Args:
+            time: 구간 시간 배열
+            columns: 열 이름 -> 구간 배열
+            start_index: 아카이브 내 구간 시작 행 번호
+        """
+        self.time = time
+        self.columns = columns
+        self.start_index = int(start_index)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    def __len__(self) -> int:
+        return self.time.shape[0]
+
+    def minutes(self) -> np.ndarray:
+        """구간 시작 기준 경과 시간 (분)"""
+        if len(self) == 0:
+            return np.zeros(0)
+        return (self.time - self.time[0]) / np.timedelta64(1, "m")
+
+
+class WindArchive:
+    """
+    정렬된 시간 인덱스와 메모리 맵 열 저장소를 가진 풍속 아카이브 클래스
+    """
+
+    def __init__(self, path: os.PathLike):
+        """
+        기존 아카이브를 엽니다 (메모리 맵, 읽기 전용).
+
+        Args:
+            path: 아카이브 디렉터리 경로
+        """
+        self.path = Path(path)
+        self._open()
+
+    def _open(self) -> None:
+        """현재 세대를 메모리 맵으로 열고 열별 행 수를 meta.json과 대조합니다."""
+        self.generation = (self.path / _CURRENT).read_text(encoding="utf-8").strip()
+        directory = self.path / self.generation
+        with open(directory / "meta.json", encoding="utf-8") as meta_file:
+            self.meta = json.load(meta_file)
+        self.time = np.load(directory / "time.npy", mmap_mode="r")
+        self.columns = {name: np.load(directory / f"{name}.npy", mmap_mode="r")
+                        for name in self.meta["columns"]}
+
+        n_rows = self.meta["n_rows"]
+        for name, values in [("time", self.time)] + list(self.columns.items()):
+            if values.shape[0] != n_rows:
+                raise ValueError(f"아카이브 열 '{name}'의 행 수가 meta.json과 다릅니다: "
+                                 f"{values.shape[0]} != {n_rows}")
+
+    def __len__(self) -> int:
+        return self.time.shape[0]
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self.columns)
+
+    @staticmethod
+    def _prepare(times: np.ndarray, columns: Dict[str, np.ndarray]):
+        times = np.asarray(times).astype(_TIME_DTYPE)
+        if times.ndim != 1:
+            raise ValueError("시간 배열은 1차원이어야 합니다.")
+        if times.shape[0] > 1 and not np.all(times[1:] > times[:-1]):
+            raise ValueError("시간 배열은 중복 없이 오름차순이어야 합니다.")
+        prepared = {}
+        for name, values in columns.items():
+            if name in _RESERVED_NAMES or not _COLUMN_NAME.fullmatch(name):
+                raise ValueError(f"사용할 수 없는 열 이름입니다: {name!r} "
+                                 f"(영문자/숫자/밑줄, {_RESERVED_NAMES} 제외)")
+            values = np.asarray(values)
+            if values.shape[0] != times.shape[0]:
+                raise ValueError(f"열 '{name}'의 길이가 시간 배열과 다릅니다.")
+            prepared[name] = values
+        return times, prepared
+
+    @classmethod
+    def create(cls, path: os.PathLike, times: np.ndarray,
+               columns: Dict[str, np.ndarray], overwrite: bool = False) -> "WindArchive":
+        """
+        새 아카이브를 만듭니다.
+
+        Args:
+            path: 아카이브 디렉터리 경로
+            times: 오름차순 시간 배열 (datetime64 또는 ISO 문자열)
+            columns: 열 이름 -> 데이터 배열
+            overwrite: 기존 아카이브를 덮어쓸지 여부 (CURRENT 파일이 있는 아카이브만 삭제)
+
+        Returns:
+            열린 WindArchive
+        """
+        path = Path(path)
+        if path.exists():
+            if not overwrite:
+                raise FileExistsError(f"아카이브가 이미 존재합니다: {path}")
+            if not (path / _CURRENT).is_file():
+                raise FileExistsError(f"아카이브가 아닌 경로는 덮어쓰지 않습니다: {path}")
+            shutil.rmtree(path)
+        times, columns = cls._prepare(times, columns)
+
+        path.mkdir(parents=True)
+        generation = path / _GENERATION_FORMAT.format(0)
+        generation.mkdir()
+        np.save(generation / "time.npy", times)
+        for name, values in columns.items():
+            np.save(generation / f"{name}.npy", values)
+        cls._write_meta(generation, columns, times.shape[0])
+        cls._switch(path, generation.name)
+        return cls(path)
+
+    @staticmethod
+    def _write_meta(directory: Path, columns: Dict[str, np.ndarray], n_rows: int) -> None:
+        meta = {"columns": {name: values.dtype.str for name, values in columns.items()},
+                "n_rows": int(n_rows), "time_dtype": _TIME_DTYPE}
+        (directory / "meta.json").write_text(json.dumps(meta), encoding="utf-8")
+
+    @staticmethod
+    def _switch(path: Path, generation: str) -> None:
+        """CURRENT 파일을 원자적으로 교체해 현재 세대를 바꿉니다."""
+        temporary = path / f"{_CURRENT}.tmp"
+        temporary.write_text(generation, encoding="utf-8")
+        os.replace(temporary, path / _CURRENT)
+
+    def append(self, times: np.ndarray, columns: Dict[str, np.ndarray]) -> None:
+        """
+        마지막 시각 이후의 데이터를 덧붙입니다.
+        새 세대 디렉터리에 기존 데이터와 추가 데이터를 모두 기록한 뒤
+        CURRENT 파일 하나를 교체하여 원자적으로 전환하고, 이전 세대는 삭제합니다.
+
+        Args:
+            times: 오름차순 시간 배열 (아카이브 마지막 시각 이후)
+            columns: 모든 기존 열에 대한 추가 데이터 (기존 열과 같은 dtype)
+        """
+        times, columns = self._prepare(times, columns)
+        if set(columns) != set(self.columns):
+            raise ValueError(f"추가 데이터의 열은 기존 열과 같아야 합니다: {self.column_names}")
+        for name, values in columns.items():
+            old = self.columns[name]
+            if values.dtype != old.dtype or values.shape[1:] != old.shape[1:]:
+                raise ValueError(f"열 '{name}'의 dtype/형상이 기존 열({old.dtype}, "
+                                 f"{old.shape[1:]})과 다릅니다: {values.dtype}, {values.shape[1:]}")
+        if len(self) and times.shape[0] and times[0] <= self.time[-1]:
+            raise ValueError("추가 데이터는 아카이브 마지막 시각 이후여야 합니다.")
+
+        previous = self.path / self.generation
+        number = int(self.generation.rsplit("-", 1)[1]) + 1
+        generation = self.path / _GENERATION_FORMAT.format(number)
+        shutil.rmtree(generation, ignore_errors=True)  # 중단된 이전 추가의 잔여물
+        generation.mkdir()
+
+        n_rows = len(self) + times.shape[0]
+        arrays = {"time": (self.time, times)}
+        arrays.update({name: (self.columns[name], columns[name]) for name in self.columns})
+        for name, (old, new) in arrays.items():
+            combined = np.lib.format.open_memmap(generation / f"{name}.npy", mode="w+",
+                                                 dtype=old.dtype, shape=(n_rows,) + old.shape[1:])
+            combined[:old.shape[0]] = old
+            combined[old.shape[0]:] = new
+            combined.flush()
+            del combined
+        self._write_meta(generation, self.columns, n_rows)
+
+        self._switch(self.path, generation.name)
+        self._open()
+        # 이전 세대를 메모리 맵으로 연 다른 프로세스가 있으면 삭제하지 못할 수 있음
+        shutil.rmtree(previous, ignore_errors=True)
+
+    def _window(self, start: int, stop: int) -> WindWindow:
+        return WindWindow(self.time[start:stop],
+                          {name: values[start:stop] for name, values in self.columns.items()},
+                          start)
+
+    def range(self, start: Optional[TimeLike] = None,
+              end: Optional[TimeLike] = None) -> WindWindow:
+        """
+        [start, end) 기간의 데이터를 이진 탐색으로 찾아 반환합니다.
+
+        Args:
+            start: 시작 시각 (None이면 처음부터)
+            end: 종료 시각, 미포함 (None이면 끝까지)
+
+        Returns:
+            복사 없는 WindWindow
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.time, np.datetime64(start, "s")))
+        hi = len(self) if end is None else int(np.searchsorted(self.time, np.datetime64(end, "s")))
+        return self._window(lo, max(lo, hi))
+
+    def windows(self, starts: np.ndarray, ends: np.ndarray) -> List[WindWindow]:
+        """
+        여러 [start, end) 구간을 한 번의 벡터화된 이진 탐색으로 찾습니다.
+        빈 구간은 제외됩니다.
+
+        Args:
+            starts: 구간 시작 시각 배열
+            ends: 구간 종료 시각 배열 (미포함)
+
+        Returns:
+            WindWindow 목록
+        """
+        lo = np.searchsorted(self.time, np.asarray(starts).astype(_TIME_DTYPE))
+        hi = np.searchsorted(self.time, np.asarray(ends).astype(_TIME_DTYPE))
+        return [self._window(int(a), int(b)) for a, b in zip(lo, hi) if b > a]
+
+    def seasonal(self, months: Optional[Iterable[int]] = None,
+                 hours: Optional[Sequence[int]] = None,
+                 start: Optional[TimeLike] = None,
+                 end: Optional[TimeLike] = None) -> List[WindWindow]:
+        """
+        계절/시간대 조건에 맞는 연속 구간들을 반환합니다.
+        예: months=(12, 1, 2), hours=(22, 6) -> 겨울철 22시~다음날 6시
+
+        Args:
+            months: 포함할 월 (1-12), None이면 모든 월 (시간대 구간은 시작일 기준)
+            hours: (시작 시, 종료 시) 시간대, 종료 시가 작으면 자정을 넘깁니다. None이면 하루 전체
+            start: 조회 시작 시각 (None이면 아카이브 처음)
+            end: 조회 종료 시각, 미포함 (None이면 아카이브 끝)
+
+        Returns:
+            시간 순 WindWindow 목록
+        """
+        if len(self) == 0:
+            return []
+        first = self.time[0] if start is None else np.datetime64(start, "s")
+        last = self.time[-1] + np.timedelta64(1, "s") if end is None else np.datetime64(end, "s")
+        month_set = None if months is None else {int(month) for month in months}
+
+        if hours is None:
+            # 월 단위 구간
+            boundaries = np.arange(first.astype("datetime64[M]"),
+                                   last.astype("datetime64[M]") + np.timedelta64(1, "M"))
+            starts = boundaries.astype(_TIME_DTYPE)
+            ends = (boundaries + np.timedelta64(1, "M")).astype(_TIME_DTYPE)
+            labels = boundaries
+        else:
+            # 일 단위 시간대 구간 (전날 밤에 시작하는 구간 포함)
+            start_hour, end_hour = (int(hour) for hour in hours)
+            days = np.arange(first.astype("datetime64[D]") - np.timedelta64(1, "D"),
+                             last.astype("datetime64[D]") + np.timedelta64(1, "D"))
+            starts = days.astype(_TIME_DTYPE) + np.timedelta64(start_hour, "h")
+            span = (end_hour - start_hour) % 24 or 24
+            ends = starts + np.timedelta64(span, "h")
+            labels = days
+
+        if month_set is not None:
+            month_numbers = labels.astype("datetime64[M]").astype(np.int64) % 12 + 1
+            keep = np.isin(month_numbers, list(month_set))
+            starts, ends = starts[keep], ends[keep]
+
+        # 조회 범위로 자르기
+        starts = np.maximum(starts, first)
+        ends = np.minimum(ends, last)
+        valid = ends > starts
+        return self.windows(starts[valid], ends[valid])